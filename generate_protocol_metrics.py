@@ -12,19 +12,80 @@ Author: Paolo Diomede
 """
 
 import os
+import argparse
+import functools
+import gzip
 import json
+import hashlib
+import heapq
+import inspect
+import re
+import sys
+import threading
+import time
 import requests
-from datetime import datetime, timezone
-from dataclasses import dataclass
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from datetime import date, datetime, timezone
+from dataclasses import asdict, dataclass
+from operator import attrgetter, itemgetter
+from string import Template
 from typing import List
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
+try:
+    import orjson  # Optional: faster JSON parsing of large GraphQL responses
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # Optional: brotli copies of the generated files for static hosting
+except ImportError:
+    brotli = None
+
 # Version of the dashboard generator
 VERSION = "0.0.2"
 
+# Number of networks shown in the dashboard table and collected indexers for
+TOP_NETWORKS = 20
+
+# GRT token amounts are reported by the subgraphs in wei (18 decimals)
+WEI_PER_GRT = 10**18
+
+# Shared HTTP session so all GraphQL queries reuse pooled keep-alive connections
+_SESSION = requests.Session()
+# Advertise every content encoding urllib3 can decode here (gzip, deflate, plus br/zstd when installed)
+_SESSION.headers.update({
+    "Content-Type": "application/json",
+    "Accept": "application/graphql-response+json, application/json;q=0.9",
+    "Accept-Encoding": ACCEPT_ENCODING,
+})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    # Rate limits (429) and gateway errors are retried with exponential backoff,
+    # waiting for the server's Retry-After header when one is sent
+    max_retries=Retry(total=4, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=frozenset({"POST"}), respect_retry_after_header=True,
+                      raise_on_status=False)
+))
+
+# Per-host circuit breaker: after this many consecutive failed requests (after retries),
+# further queries to the host fail fast for the rest of the run
+CIRCUIT_BREAKER_THRESHOLD = 5
+_HOST_FAILURES = Counter()
+_HOST_FAILURES_LOCK = threading.Lock()
+
 # Data class for network subgraph and unique indexer counts
-@dataclass
+# (explicit __slots__ rather than dataclass(slots=True) to keep Python 3.7+ support)
+@dataclass(frozen=True)
 class NetworkIndexerData:
+    __slots__ = ("network_name", "subgraph_count", "unique_indexer_count")
+    
     network_name: str
     subgraph_count: int
     unique_indexer_count: int
@@ -86,13 +147,197 @@ NETWORK_LOGOS = {
     "zetachain": "images/zetachain.png"
 }
 
+# Logo <img> markup keyed by lowercased network name, rendered once at import time
+_LOGO_HTML = {
+    name.lower(): f'<img src="{path}" alt="{name}" class="network-logo" width="24" height="24" loading="lazy" decoding="async" onerror="this.style.display=\'none\'" />'
+    for name, path in NETWORK_LOGOS.items()
+}
+
+# Display names for networks whose title-cased name is not descriptive enough
+_DISPLAY_OVERRIDES = {
+    "mainnet": "Ethereum (Mainnet)",
+    "matic": "Polygon (Matic)"
+}
+
+
 
 def log_message(message: str):
     """Log a timestamped message to console."""
     timestamped = f"[{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}] {message}"
-    print(timestamped)
+    # Emit the line and its newline in one write so concurrent fetchers don't interleave
+    print(timestamped + "\n", end="", flush=True)
+
+
+def parse_json_response(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a query to a host that keeps failing."""
+
+
+def _post(url: str, query: str) -> requests.Response:
+    """
+    Send a GraphQL query over the shared session, tracking consecutive failures per host.
+    
+    Transient errors are retried by the session's urllib3 Retry policy; a response still
+    failing with 429 or 5xx afterwards, or a connection error, counts as a failure.
+    
+    Args:
+        url: GraphQL endpoint URL
+        query: GraphQL query string
+        
+    Returns:
+        The HTTP response
+        
+    Raises:
+        CircuitOpenError: If the host has failed CIRCUIT_BREAKER_THRESHOLD times in a row
+    """
+    host = urlsplit(url).netloc
+    with _HOST_FAILURES_LOCK:
+        failures = _HOST_FAILURES[host]
+    if failures >= CIRCUIT_BREAKER_THRESHOLD:
+        raise CircuitOpenError(f"{host} failed {failures} times in a row, skipping request")
+    
+    # Any exception raised before a response is inspected counts as a failure
+    failed = True
+    try:
+        response = _SESSION.post(url, json={"query": query}, timeout=(5, 60))
+        failed = response.status_code == 429 or response.status_code >= 500
+        return response
+    finally:
+        with _HOST_FAILURES_LOCK:
+            if failed:
+                _HOST_FAILURES[host] += 1
+                if _HOST_FAILURES[host] == CIRCUIT_BREAKER_THRESHOLD:
+                    log_message(f"Circuit breaker opened for {host}")
+            else:
+                _HOST_FAILURES[host] = 0
+
+
+def wei_to_grt(wei: str) -> int:
+    """Convert a non-negative wei amount given as a decimal string to whole GRT (truncated)."""
+    return int(wei[:-18]) if len(wei) > 18 else 0
+
+
+# Day numbers in the Arbitrum analytics subgraph count whole UTC days since 2020-12-17
+ANALYTICS_GENESIS_DATE = date(2020, 12, 17)
 
 
+def day_number(year: int, month: int, day: int) -> int:
+    """Day number of a UTC calendar date in the analytics subgraph."""
+    return (date(year, month, day) - ANALYTICS_GENESIS_DATE).days
+
+
+# Quarters shown in the rewards table: (quarter, period, start day, end day (exclusive))
+QUARTERS = [
+    ('Q3-2025', 'Jul-Sep 2025', day_number(2025, 7, 1), day_number(2025, 10, 1)),
+    ('Q2-2025', 'Apr-Jun 2025', day_number(2025, 4, 1), day_number(2025, 7, 1)),
+    ('Q1-2025', 'Jan-Mar 2025', day_number(2025, 1, 1), day_number(2025, 4, 1)),
+    ('Q4-2024', 'Oct-Dec 2024', day_number(2024, 10, 1), day_number(2025, 1, 1)),
+    ('Q3-2024', 'Jul-Sep 2024', day_number(2024, 7, 1), day_number(2024, 10, 1)),
+    ('Q2-2024', 'Apr-Jun 2024', day_number(2024, 4, 1), day_number(2024, 7, 1)),
+]
+
+
+# On-disk cache of fetcher results, reused until each fetcher's TTL expires.
+# Enabled by main(); --force skips reading it but still stores fresh results.
+_FETCH_CACHE = {"enabled": False, "refresh": False, "dir": ".cache"}
+
+# Failures noted by the fetcher running on each thread; a result obtained while
+# any were noted is partial or filled with fallback data and is not cached
+_FETCH_STATUS = threading.local()
+
+
+def note_fetch_failure():
+    """Record that the current fetch had to use partial or fallback data."""
+    _FETCH_STATUS.failures = fetch_failure_count() + 1
+
+
+def fetch_failure_count() -> int:
+    """Number of failures noted on the current thread so far."""
+    return getattr(_FETCH_STATUS, "failures", 0)
+
+
+def discard_fetch_failures(count: int):
+    """Forget failures noted after `count`, when a fallback strategy replaces the data they affected."""
+    _FETCH_STATUS.failures = count
+
+
+def cached_fetch(ttl_seconds: int, decode=None, is_complete=bool):
+    """
+    Decorate a fetcher so its result is cached on disk for `ttl_seconds`.
+    
+    The cache file is keyed by the function name and its arguments other than the API
+    key, and its age is taken from the file's modification time. Results are not cached
+    when the fetcher noted a failure via note_fetch_failure() or when `is_complete`
+    rejects them; cache files that cannot be decoded are treated as a cache miss.
+    
+    Args:
+        ttl_seconds: How long a cached result stays valid
+        decode: Optional function converting the decoded JSON back to the fetcher's return type,
+            raising TypeError, KeyError, IndexError or ValueError for data of the wrong shape
+        is_complete: Predicate telling whether a result is worth caching
+    """
+    def decorator(fetch):
+        signature = inspect.signature(fetch)
+        
+        @functools.wraps(fetch)
+        def wrapper(*args, **kwargs):
+            if not _FETCH_CACHE["enabled"]:
+                return fetch(*args, **kwargs)
+            
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = "".join(f"_{name}-{value}" for name, value in bound.arguments.items() if name != "api_key")
+            cache_dir = _FETCH_CACHE["dir"]
+            path = os.path.join(cache_dir, f"{fetch.__name__}{key}.json")
+            
+            if not _FETCH_CACHE["refresh"]:
+                try:
+                    if time.time() - os.path.getmtime(path) < ttl_seconds:
+                        with open(path, 'rb') as f:
+                            raw = f.read()
+                        value = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                        if decode:
+                            value = decode(value)
+                        log_message(f"Using cached {fetch.__name__} result from {path}")
+                        return value
+                except (OSError, ValueError):
+                    pass
+                except (TypeError, KeyError, IndexError) as e:
+                    # Written in a different shape, e.g. by an older version of the fetcher
+                    log_message(f"Ignoring unreadable cache file {path}: {e}")
+            
+            failures = fetch_failure_count()
+            result = fetch(*args, **kwargs)
+            if fetch_failure_count() > failures or not is_complete(result):
+                return result
+            
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                tmp_path = path + ".tmp"
+                if orjson is not None:
+                    with open(tmp_path, 'wb') as f:
+                        f.write(orjson.dumps(result))
+                else:
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        json.dump(result, f, default=asdict)
+                os.replace(tmp_path, path)
+            except (OSError, TypeError) as e:
+                log_message(f"Could not cache {fetch.__name__} result: {e}")
+            return result
+        return wrapper
+    return decorator
+
+
+@cached_fetch(ttl_seconds=86400, decode=lambda rows: [
+    {field: row[field] for field in ('quarter', 'period', 'total_rewards', 'indexer_rewards', 'delegator_rewards')}
+    for row in rows
+])
 def fetch_quarterly_arbitrum_data(api_key: str) -> list:
     """
     Fetch quarterly rewards distribution data for Arbitrum network.
@@ -103,78 +348,49 @@ def fetch_quarterly_arbitrum_data(api_key: str) -> list:
     Returns:
         List of dictionaries containing quarterly data
     """
-    from datetime import datetime as dt
-    
     log_message("Fetching Arbitrum quarterly data...")
     
     ARBITRUM_ANALYTICS_SUBGRAPH_ID = "AgV4u2z1BFZKSj4Go1AdQswUGW2FcAtnPhifd4V7NLVz"
     base_url = "https://gateway-arbitrum.network.thegraph.com/api"
     url = f"{base_url}/{api_key}/subgraphs/id/{ARBITRUM_ANALYTICS_SUBGRAPH_ID}"
-    headers = {"Content-Type": "application/json"}
-    
-    def timestamp_to_day_number(timestamp):
-        """Convert timestamp to approximate day number."""
-        genesis_timestamp = 1608134400  # 2020-12-17 00:00:00 UTC
-        return int((timestamp - genesis_timestamp) / 86400)
-    
-    def get_network_data_for_day(day_number: int):
-        """Get network data for a specific day number."""
-        query = f"""
-        {{
-          graphNetworkDailyDatas(where: {{dayNumber: {day_number}}}) {{
-            dayNumber
-            dayStart
-            totalIndexingRewards
-            totalIndexingIndexerRewards
-            totalIndexingDelegatorRewards
-            indexerCount
-          }}
-        }}
-        """
-        
-        try:
-            response = requests.post(url, json={"query": query}, headers=headers)
-            if response.status_code == 200:
-                data = response.json().get("data", {}).get("graphNetworkDailyDatas", [])
-                if data:
-                    return data[0]
-        except Exception as e:
-            log_message(f"Error fetching day {day_number}: {e}")
-        return None
     
-    # Define quarters including Q3-2025
-    quarters = [
-        ('Q3-2025', 'Jul-Sep 2025',
-         timestamp_to_day_number(dt(2025, 7, 1).timestamp()),
-         timestamp_to_day_number(dt(2025, 10, 1).timestamp())),
-        ('Q2-2025', 'Apr-Jun 2025',
-         timestamp_to_day_number(dt(2025, 4, 1).timestamp()),
-         timestamp_to_day_number(dt(2025, 7, 1).timestamp())),
-        ('Q1-2025', 'Jan-Mar 2025',
-         timestamp_to_day_number(dt(2025, 1, 1).timestamp()),
-         timestamp_to_day_number(dt(2025, 4, 1).timestamp())),
-        ('Q4-2024', 'Oct-Dec 2024',
-         timestamp_to_day_number(dt(2024, 10, 1).timestamp()),
-         timestamp_to_day_number(dt(2025, 1, 1).timestamp())),
-        ('Q3-2024', 'Jul-Sep 2024',
-         timestamp_to_day_number(dt(2024, 7, 1).timestamp()),
-         timestamp_to_day_number(dt(2024, 10, 1).timestamp())),
-        ('Q2-2024', 'Apr-Jun 2024',
-         timestamp_to_day_number(dt(2024, 4, 1).timestamp()),
-         timestamp_to_day_number(dt(2024, 7, 1).timestamp())),
-    ]
+    # Fetch the start and end day of every quarter in a single request
+    day_numbers = sorted({day for _, _, start_day, end_day in QUARTERS for day in (start_day, end_day - 1)})
+    query = f"""
+    {{
+      graphNetworkDailyDatas(where: {{dayNumber_in: {json.dumps(day_numbers)}}}, first: {len(day_numbers)}) {{
+        dayNumber
+        dayStart
+        totalIndexingRewards
+        totalIndexingIndexerRewards
+        totalIndexingDelegatorRewards
+        indexerCount
+      }}
+    }}
+    """
+    
+    day_data = {}
+    try:
+        response = _post(url, query)
+        if response.status_code == 200:
+            for row in parse_json_response(response).get("data", {}).get("graphNetworkDailyDatas", []):
+                day_data[int(row["dayNumber"])] = row
+        else:
+            log_message(f"Failed to fetch quarterly day data: {response.status_code}")
+    except Exception as e:
+        log_message(f"Error fetching quarterly day data: {e}")
     
     quarterly_data = []
     
-    for quarter, period, start_day, end_day in quarters:
+    for quarter, period, start_day, end_day in QUARTERS:
         try:
-            start_data = get_network_data_for_day(start_day)
-            end_data = get_network_data_for_day(end_day - 1)
+            start_data = day_data.get(start_day)
+            end_data = day_data.get(end_day - 1)
             
             if start_data and end_data:
-                total_rewards = (int(end_data['totalIndexingRewards']) - int(start_data['totalIndexingRewards'])) // 10**18
-                indexer_rewards = (int(end_data['totalIndexingIndexerRewards']) - int(start_data['totalIndexingIndexerRewards'])) // 10**18
-                delegator_rewards = (int(end_data['totalIndexingDelegatorRewards']) - int(start_data['totalIndexingDelegatorRewards'])) // 10**18
+                total_rewards = (int(end_data['totalIndexingRewards']) - int(start_data['totalIndexingRewards'])) // WEI_PER_GRT
+                indexer_rewards = (int(end_data['totalIndexingIndexerRewards']) - int(start_data['totalIndexingIndexerRewards'])) // WEI_PER_GRT
+                delegator_rewards = (int(end_data['totalIndexingDelegatorRewards']) - int(start_data['totalIndexingDelegatorRewards'])) // WEI_PER_GRT
                 
                 quarterly_data.append({
                     'quarter': quarter,
@@ -190,6 +406,7 @@ def fetch_quarterly_arbitrum_data(api_key: str) -> list:
     # Fallback data if needed
     if len(quarterly_data) < 6:
         log_message("Using fallback data for missing quarters")
+        note_fetch_failure()
         fallback_data = [
             ('Q3-2025', 'Jul-Sep 2025', 58420000, 25503600, 32916400),
             ('Q2-2025', 'Apr-Jun 2025', 56280000, 24562200, 31717800),
@@ -213,6 +430,9 @@ def fetch_quarterly_arbitrum_data(api_key: str) -> list:
     return quarterly_data
 
 
+@cached_fetch(ttl_seconds=3600,
+              decode=lambda stats: {'arbitrum': dict(stats['arbitrum']), 'ethereum': dict(stats['ethereum'])},
+              is_complete=lambda result: bool(result['arbitrum']))
 def fetch_network_comparison_stats(api_key: str) -> dict:
     """
     Fetch network statistics for Arbitrum. Ethereum data is hardcoded since the network is inactive.
@@ -229,7 +449,6 @@ def fetch_network_comparison_stats(api_key: str) -> dict:
     ARBITRUM_SUBGRAPH_ID = "DZz4kDTdmzWLWsV373w2bSmoar3umKKH9y82SUKr5qmp"
     
     base_url = "https://gateway-arbitrum.network.thegraph.com/api"
-    headers = {"Content-Type": "application/json"}
     
     query = """
     {
@@ -256,27 +475,48 @@ def fetch_network_comparison_stats(api_key: str) -> dict:
         'ethereum': ETHEREUM_STATIC_DATA
     }
     
-    # Helper function to count all active delegators with pagination
-    def count_active_delegators(url, headers, network_name):
+    # Helper function to count all active delegators
+    def count_active_delegators(url, network_name):
+        log_message(f"Counting active delegators for {network_name}...")
+        
+        # Prefer the aggregate counter maintained by the subgraph (one request)
+        count_query = """
+        {
+          graphNetwork(id: "1") {
+            activeDelegatorCount
+          }
+        }
+        """
+        try:
+            response = _post(url, count_query)
+            if response.status_code == 200:
+                payload = parse_json_response(response)
+                count = ((payload.get("data") or {}).get("graphNetwork") or {}).get("activeDelegatorCount")
+                if count is not None and not payload.get("errors"):
+                    active_delegators_count = int(count)
+                    log_message(f"{network_name} active delegators: {active_delegators_count:,}")
+                    return active_delegators_count
+        except Exception as e:
+            log_message(f"Error fetching active delegator count: {e}")
+        
+        # Fall back to keyset pagination over ids, which avoids Graph Node's growing cost for large skips
         active_delegators_count = 0
-        skip = 0
+        last_id = ""
         batch_size = 1000
         
-        log_message(f"Counting active delegators for {network_name}...")
-        
         while True:
             active_delegators_query = f"""
             {{
-              delegators(where: {{activeStakesCount_gt: 0}}, first: {batch_size}, skip: {skip}) {{
+              delegators(where: {{activeStakesCount_gt: 0, id_gt: {json.dumps(last_id)}}}, first: {batch_size}, orderBy: id, orderDirection: asc) {{
                 id
               }}
             }}
             """
             
             try:
-                response = requests.post(url, json={"query": active_delegators_query}, headers=headers)
+                response = _post(url, active_delegators_query)
                 if response.status_code == 200:
-                    delegators = response.json().get("data", {}).get("delegators", [])
+                    delegators = parse_json_response(response).get("data", {}).get("delegators", [])
                     batch_count = len(delegators)
                     active_delegators_count += batch_count
                     
@@ -284,11 +524,14 @@ def fetch_network_comparison_stats(api_key: str) -> dict:
                     if batch_count < batch_size:
                         break
                     
-                    skip += batch_size
+                    last_id = delegators[-1]["id"]
                 else:
+                    log_message(f"Failed to count active delegators: {response.status_code}")
+                    note_fetch_failure()
                     break
             except Exception as e:
                 log_message(f"Error counting active delegators: {e}")
+                note_fetch_failure()
                 break
         
         log_message(f"{network_name} active delegators: {active_delegators_count:,}")
@@ -297,17 +540,17 @@ def fetch_network_comparison_stats(api_key: str) -> dict:
     # Fetch Arbitrum stats
     try:
         arb_url = f"{base_url}/{api_key}/subgraphs/id/{ARBITRUM_SUBGRAPH_ID}"
-        response = requests.post(arb_url, json={"query": query}, headers=headers)
+        response = _post(arb_url, query)
         if response.status_code == 200:
-            data = response.json().get("data", {}).get("graphNetwork", {})
+            data = parse_json_response(response).get("data", {}).get("graphNetwork", {})
             if data:
                 # Get full count of active delegators with pagination
-                active_delegators_count = count_active_delegators(arb_url, headers, "Arbitrum")
+                active_delegators_count = count_active_delegators(arb_url, "Arbitrum")
                 
                 result['arbitrum'] = {
-                    'total_rewards': int(data.get("totalIndexingRewards", "0")) // 10**18,
-                    'indexer_rewards': int(data.get("totalIndexingIndexerRewards", "0")) // 10**18,
-                    'delegator_rewards': int(data.get("totalIndexingDelegatorRewards", "0")) // 10**18,
+                    'total_rewards': wei_to_grt(data.get("totalIndexingRewards", "0")),
+                    'indexer_rewards': wei_to_grt(data.get("totalIndexingIndexerRewards", "0")),
+                    'delegator_rewards': wei_to_grt(data.get("totalIndexingDelegatorRewards", "0")),
                     'delegator_count': int(data.get("delegatorCount", "0")),
                     'active_delegators': active_delegators_count
                 }
@@ -320,20 +563,31 @@ def fetch_network_comparison_stats(api_key: str) -> dict:
     return result
 
 
-def fetch_rewards_metrics(api_key: str) -> tuple:
+def fetch_rewards_metrics(api_key: str, network_comparison: dict = None) -> tuple:
     """
     Fetch rewards distribution metrics from The Graph Network (Arbitrum).
     
+    The network comparison stats query the same `graphNetwork` entity, so when they
+    are passed in, the rewards are taken from them instead of being queried again.
+    
     Args:
         api_key: The Graph API key
+        network_comparison: Optional result of fetch_network_comparison_stats()
         
     Returns:
         Tuple of (total_rewards, indexer_rewards, delegator_rewards)
     """
+    arbitrum = (network_comparison or {}).get('arbitrum')
+    if arbitrum:
+        total_rewards = arbitrum['total_rewards']
+        indexer_rewards = arbitrum['indexer_rewards']
+        delegator_rewards = arbitrum['delegator_rewards']
+        log_message(f"Rewards metrics (from network stats): Total={total_rewards:,}, Indexers={indexer_rewards:,}, Delegators={delegator_rewards:,}")
+        return (total_rewards, indexer_rewards, delegator_rewards)
+    
     # Arbitrum Network Subgraph ID
     subgraph_id = "DZz4kDTdmzWLWsV373w2bSmoar3umKKH9y82SUKr5qmp"
     url = f"https://gateway-arbitrum.network.thegraph.com/api/{api_key}/subgraphs/id/{subgraph_id}"
-    headers = {"Content-Type": "application/json"}
     
     log_message("Fetching rewards distribution metrics...")
     
@@ -348,14 +602,14 @@ def fetch_rewards_metrics(api_key: str) -> tuple:
     """
     
     try:
-        response = requests.post(url, json={"query": query}, headers=headers)
+        response = _post(url, query)
         if response.status_code == 200:
-            data = response.json().get("data", {}).get("graphNetwork", {})
+            data = parse_json_response(response).get("data", {}).get("graphNetwork", {})
             if data:
                 # Convert from wei to GRT (divide by 10^18)
-                total_rewards = int(data.get("totalIndexingRewards", "0")) // 10**18
-                indexer_rewards = int(data.get("totalIndexingIndexerRewards", "0")) // 10**18
-                delegator_rewards = int(data.get("totalIndexingDelegatorRewards", "0")) // 10**18
+                total_rewards = wei_to_grt(data.get("totalIndexingRewards", "0"))
+                indexer_rewards = wei_to_grt(data.get("totalIndexingIndexerRewards", "0"))
+                delegator_rewards = wei_to_grt(data.get("totalIndexingDelegatorRewards", "0"))
                 
                 log_message(f"Rewards metrics: Total={total_rewards:,}, Indexers={indexer_rewards:,}, Delegators={delegator_rewards:,}")
                 return (total_rewards, indexer_rewards, delegator_rewards)
@@ -370,6 +624,27 @@ def fetch_rewards_metrics(api_key: str) -> tuple:
         return (0, 0, 0)
 
 
+def fetch_network_comparison_and_rewards(api_key: str) -> tuple:
+    """
+    Fetch the network comparison stats followed by the rewards metrics derived from them.
+    
+    Args:
+        api_key: The Graph API key
+        
+    Returns:
+        Tuple of (network_comparison, rewards_metrics)
+    """
+    network_comparison = fetch_network_comparison_stats(api_key)
+    return network_comparison, fetch_rewards_metrics(api_key, network_comparison)
+
+
+def _decode_delegation_metrics(value) -> tuple:
+    """Rebuild the fetch_delegation_metrics() tuple from its cached JSON list."""
+    total_delegated, total_undelegated, net, events_list = value
+    return (int(total_delegated), int(total_undelegated), int(net), list(events_list))
+
+
+@cached_fetch(ttl_seconds=300, decode=_decode_delegation_metrics, is_complete=lambda result: bool(result[3]))
 def fetch_delegation_metrics(api_key: str) -> tuple:
     """
     Fetch delegation and undelegation metrics from The Graph Network.
@@ -381,7 +656,6 @@ def fetch_delegation_metrics(api_key: str) -> tuple:
         Tuple of (total_delegated, total_undelegated, net, events_list)
     """
     url = f"https://gateway.thegraph.com/api/{api_key}/subgraphs/id/9wzatP4KXm4WinEhB31MdKST949wCH8ZnkGe8o3DLTwp"
-    headers = {"Content-Type": "application/json"}
     
     log_message("Fetching delegation metrics...")
     
@@ -411,51 +685,58 @@ def fetch_delegation_metrics(api_key: str) -> tuple:
     }
     """
     
-    events_list = []
+    delegation_events = []
+    undelegation_events = []
     
     try:
-        # Fetch delegations
-        response_del = requests.post(url, json={"query": query_delegations}, headers=headers)
+        # Both event queries are independent, so send them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            delegations_future = executor.submit(_post, url, query_delegations)
+            undelegations_future = executor.submit(_post, url, query_undelegations)
+            response_del = delegations_future.result()
+            response_undel = undelegations_future.result()
+        
+        # Process delegations
         if response_del.status_code == 200:
-            delegations = response_del.json().get("data", {}).get("stakeDelegateds", [])
-            total_delegated = sum(int(d["tokens"]) for d in delegations) // 10**18
+            delegations = parse_json_response(response_del).get("data", {}).get("stakeDelegateds", [])
+            total_delegated = sum(int(d["tokens"]) for d in delegations) // WEI_PER_GRT
             
-            # Add to events list
-            for d in delegations:
-                events_list.append({
-                    "type": "delegation",
-                    "tokens": int(d["tokens"]) // 10**18,
-                    "delegator": d["delegator"],
-                    "indexer": d["indexer"],
-                    "timestamp": int(d["blockTimestamp"]),
-                    "tx_hash": d["transactionHash"]
-                })
+            # Build events (already ordered by blockTimestamp desc by the query)
+            delegation_events = [{
+                "type": "delegation",
+                "tokens": wei_to_grt(d["tokens"]),
+                "delegator": d["delegator"],
+                "indexer": d["indexer"],
+                "timestamp": int(d["blockTimestamp"]),
+                "tx_hash": d["transactionHash"]
+            } for d in delegations]
         else:
             log_message(f"Failed to fetch delegations: {response_del.status_code}")
+            note_fetch_failure()
             total_delegated = 0
         
-        # Fetch undelegations
-        response_undel = requests.post(url, json={"query": query_undelegations}, headers=headers)
+        # Process undelegations
         if response_undel.status_code == 200:
-            undelegations = response_undel.json().get("data", {}).get("stakeDelegatedLockeds", [])
-            total_undelegated = sum(int(u["tokens"]) for u in undelegations) // 10**18
+            undelegations = parse_json_response(response_undel).get("data", {}).get("stakeDelegatedLockeds", [])
+            total_undelegated = sum(int(u["tokens"]) for u in undelegations) // WEI_PER_GRT
             
-            # Add to events list
-            for u in undelegations:
-                events_list.append({
-                    "type": "undelegation",
-                    "tokens": int(u["tokens"]) // 10**18,
-                    "delegator": u["delegator"],
-                    "indexer": u["indexer"],
-                    "timestamp": int(u["blockTimestamp"]),
-                    "tx_hash": u["transactionHash"]
-                })
+            # Build events (already ordered by blockTimestamp desc by the query)
+            undelegation_events = [{
+                "type": "undelegation",
+                "tokens": wei_to_grt(u["tokens"]),
+                "delegator": u["delegator"],
+                "indexer": u["indexer"],
+                "timestamp": int(u["blockTimestamp"]),
+                "tx_hash": u["transactionHash"]
+            } for u in undelegations]
         else:
             log_message(f"Failed to fetch undelegations: {response_undel.status_code}")
+            note_fetch_failure()
             total_undelegated = 0
         
-        # Sort events by timestamp descending
-        events_list.sort(key=lambda x: x["timestamp"], reverse=True)
+        # Merge the two descending lists into one (linear, and stable like the previous sort)
+        events_list = list(heapq.merge(delegation_events, undelegation_events,
+                                       key=itemgetter("timestamp"), reverse=True))
         
         net = total_delegated - total_undelegated
         log_message(f"Delegation metrics: Delegated={total_delegated:,}, Undelegated={total_undelegated:,}, Net={net:,}")
@@ -464,38 +745,310 @@ def fetch_delegation_metrics(api_key: str) -> tuple:
         
     except Exception as e:
         log_message(f"Error fetching delegation metrics: {e}")
+        note_fetch_failure()
         return (0, 0, 0, [])
 
 
-def fetch_network_subgraph_counts(api_key: str) -> List[NetworkIndexerData]:
+def fetch_paginated(url: str, query_template: str, entity: str, page_size: int = 1000, page_workers: int = 8):
     """
-    Fetch network names and count subgraphs and unique indexers per network.
+    Fetch a paginated GraphQL collection, requesting several pages concurrently.
+    
+    No new offsets are requested once any page comes back short, empty or failed, and
+    queued offsets past that page are skipped. Requests already in flight at that point
+    (at most `page_workers - 1` past the end) still complete and are discarded.
     
     Args:
-        api_key: The Graph API key
+        url: GraphQL endpoint URL
+        query_template: Query with `{first}` and `{skip}` placeholders (literal braces doubled)
+        entity: Name of the collection field in the response data
+        page_size: Number of items requested per page
+        page_workers: Number of pages requested concurrently
+        
+    Yields:
+        Lists of items, one per page in `skip` order, stopping at the first short, empty or failed page
+        (a failed page is recorded with note_fetch_failure(), so the partial result is not cached)
+    """
+    # Offset of the lowest page known to end the collection, shared with the worker threads
+    end_skip = None
+    end_lock = threading.Lock()
+    
+    def fetch_page(skip: int):
+        """Fetch one page unless it is past a known end; returns None if the request failed."""
+        nonlocal end_skip
+        if end_skip is not None and skip > end_skip:
+            return []
+        
+        batch = request_page(skip)
+        if batch is None or len(batch) < page_size:
+            with end_lock:
+                if end_skip is None or skip < end_skip:
+                    end_skip = skip
+        return batch
+    
+    def request_page(skip: int):
+        """Send the query for one page; returns None if the request failed."""
+        query = query_template.format(first=page_size, skip=skip)
+        try:
+            response = _post(url, query)
+            if response.status_code != 200:
+                log_message(f"Failed to fetch data: {response.status_code}")
+                return None
+            payload = parse_json_response(response)
+        except (requests.RequestException, ValueError) as e:
+            log_message(f"Error fetching {entity}: {e}")
+            return None
+
+        if payload and payload.get("errors"):
+            log_message(f"GraphQL error fetching {entity}: {payload['errors'][0].get('message')}")
+            return None
+        return (payload.get("data") or {}).get(entity, []) if payload else []
+
+    # Fetch the first page on its own: collections that fit in a single page
+    # finish here without speculative requests past the end
+    batch = fetch_page(0)
+    if batch is None:
+        note_fetch_failure()
+        log_message(f"Stopped fetching {entity}: first page failed")
+    if not batch:
+        return
+    yield batch
+    if len(batch) < page_size:
+        return
+    
+    # Keep a rolling window of page requests in flight: each consumed page
+    # schedules the next offset, so one slow page does not stall a whole batch.
+    # Results are yielded on the caller's thread in `skip` order.
+    next_skip = page_size
+    pages = 1
+    with ThreadPoolExecutor(max_workers=page_workers) as executor:
+        pending = deque()
+        for _ in range(page_workers):
+            pending.append(executor.submit(fetch_page, next_skip))
+            next_skip += page_size
+        
+        try:
+            while pending:
+                batch = pending.popleft().result()
+                if batch is None:
+                    note_fetch_failure()
+                    log_message(f"Stopped fetching {entity} early after {pages} pages; results are incomplete")
+                if not batch:
+                    return
+                
+                yield batch
+                pages += 1
+                
+                # A short page means there is nothing left to fetch
+                if len(batch) < page_size:
+                    return
+                
+                # Stop extending the window once a later page has already come back short
+                if end_skip is None:
+                    pending.append(executor.submit(fetch_page, next_skip))
+                    next_skip += page_size
+        finally:
+            # Drop speculative requests past the end that have not started yet
+            for future in pending:
+                future.cancel()
+
+
+def add_indexer_ids(indexer_ids: set, allocations):
+    """Add the indexer ids of a list of allocations to a set."""
+    try:
+        # Fast path: one bulk update for well-formed allocation lists
+        indexer_ids.update([sys.intern(alloc["indexer"]["id"]) for alloc in allocations])
+    except (KeyError, TypeError):
+        for alloc in allocations:
+            try:
+                indexer_ids.add(sys.intern(alloc["indexer"]["id"]))
+            except (KeyError, TypeError):
+                continue
+
+
+def fetch_counts_only(url: str) -> Counter:
+    """
+    Count subgraphs per network without fetching indexer allocations.
+    
+    Args:
+        url: Network subgraph endpoint URL
         
     Returns:
-        List of NetworkIndexerData objects
+        Counter mapping network name to subgraph count
     """
-    url = f"https://gateway.thegraph.com/api/{api_key}/subgraphs/id/DZz4kDTdmzWLWsV373w2bSmoar3umKKH9y82SUKr5qmp"
-    headers = {"Content-Type": "application/json"}
-    counts = {}
-    indexers_by_network = {}
-    skip = 0
-    page_size = 1000
+    query_template = """{{
+        subgraphs(first: {first}, skip: {skip}, where: {{ currentVersion_not: null }}) {{
+            currentVersion {{
+                subgraphDeployment {{
+                    manifest {{
+                        network
+                    }}
+                }}
+            }}
+        }}
+    }}"""
+    
+    counts = Counter()
+    for batch in fetch_paginated(url, query_template, "subgraphs"):
+        page_networks = []
+        for item in batch:
+            try:
+                network = item["currentVersion"]["subgraphDeployment"]["manifest"]["network"]
+            except (KeyError, TypeError):
+                continue
+            if network:
+                page_networks.append(network)
+        # Count the whole page in one C-level update; network names repeat across
+        # thousands of subgraphs, so interned keys hash once
+        counts.update(map(sys.intern, page_networks))
+    
+    return counts
 
-    log_message("Fetching network subgraph counts...")
+
+def fetch_deployment_indexers(url: str, deployment_id: str) -> set:
+    """
+    Page through all active allocations of a single deployment and collect its indexer ids.
+    
+    Args:
+        url: Network subgraph endpoint URL
+        deployment_id: Subgraph deployment id
+        
+    Returns:
+        Set of indexer ids
+    """
+    query_template = """{{
+        allocations(first: {first}, skip: {skip}, where: {{ subgraphDeployment: %s, status: Active }}) {{
+            indexer {{
+                id
+            }}
+        }}
+    }}""" % json.dumps(deployment_id)
+    
+    indexer_ids = set()
+    for batch in fetch_paginated(url, query_template, "allocations"):
+        add_indexer_ids(indexer_ids, batch)
+    return indexer_ids
+
+
+def fetch_active_allocation_indexers(url: str, networks: set) -> defaultdict:
+    """
+    Collect indexers per network from one paginated scan of all active allocations.
+    
+    Like the deployment queries, only deployments used by an active subgraph are counted.
     
-    while True:
-        query = f"""{{
-            subgraphs(first: {page_size}, skip: {skip}, where: {{ currentVersion_not: null }}) {{
+    Args:
+        url: Network subgraph endpoint URL
+        networks: Network names to collect indexers for
+        
+    Returns:
+        defaultdict mapping network name to a set of indexer ids
+    """
+    query_template = """{{
+        allocations(first: {first}, skip: {skip}, where: {{ status: Active, subgraphDeployment_: {{ activeSubgraphCount_gt: 0 }} }}) {{
+            indexer {{
                 id
+            }}
+            subgraphDeployment {{
+                manifest {{
+                    network
+                }}
+            }}
+        }}
+    }}"""
+    
+    # Maps each wanted name to its canonical (interned) object: one lookup both filters
+    # the network and yields a key that compares by identity
+    canonical = {network: sys.intern(network) for network in networks}
+    indexers_by_network = defaultdict(set)
+    for batch in fetch_paginated(url, query_template, "allocations"):
+        for alloc in batch:
+            try:
+                network = canonical.get(alloc["subgraphDeployment"]["manifest"]["network"])
+                indexer_id = alloc["indexer"]["id"]
+            except (KeyError, TypeError):
+                continue
+            if network is not None:
+                indexers_by_network[network].add(sys.intern(indexer_id))
+    
+    return indexers_by_network
+
+
+def fetch_indexers_for(url: str, networks: set, allocations_per_deployment: int = 50) -> defaultdict:
+    """
+    Collect the unique indexers actively allocating to subgraphs on the given networks.
+    
+    Scans the active allocations directly, which returns each allocation once instead of
+    nesting allocation lists in every deployment. If that scan returns nothing, queries
+    only the deployments of those networks, and if the filtered query is not supported
+    by the endpoint, falls back to the full subgraph listing and filters client-side.
+    Nested allocations are capped per deployment, and deployments that hit the cap are
+    paginated separately so no indexers are missed.
+    
+    Args:
+        url: Network subgraph endpoint URL
+        networks: Network names to collect indexers for
+        allocations_per_deployment: Number of nested allocations requested per deployment
+        
+    Returns:
+        defaultdict mapping network name to a set of indexer ids
+    """
+    if not networks:
+        return defaultdict(set)
+    
+    failures = fetch_failure_count()
+    indexers_by_network = fetch_active_allocation_indexers(url, networks)
+    if indexers_by_network:
+        return indexers_by_network
+    
+    # The scan yielded nothing (e.g. the query is not supported), so a failure it noted
+    # does not affect the result of the fallback queries below
+    discard_fetch_failures(failures)
+    log_message("Active allocation scan returned no data, querying deployments for indexers...")
+    canonical = {network: sys.intern(network) for network in networks}
+    truncated = []
+    
+    def collect(deployment: dict, network: str):
+        """Add a deployment's indexers to its network, noting possibly truncated allocation lists."""
+        allocations = deployment.get("indexerAllocations") or ()
+        add_indexer_ids(indexers_by_network[network], allocations)
+        if len(allocations) >= allocations_per_deployment and deployment.get("id"):
+            truncated.append((network, deployment["id"]))
+    
+    network_list = json.dumps(sorted(networks))
+    query_template = """{{
+        subgraphDeployments(first: {first}, skip: {skip}, where: {{ activeSubgraphCount_gt: 0, manifest_: {{ network_in: %s }} }}) {{
+            id
+            manifest {{
+                network
+            }}
+            indexerAllocations(first: %d, where: {{ status: Active }}) {{
+                indexer {{
+                    id
+                }}
+            }}
+        }}
+    }}""" % (network_list, allocations_per_deployment)
+    
+    for batch in fetch_paginated(url, query_template, "subgraphDeployments"):
+        for deployment in batch:
+            try:
+                network = canonical.get(deployment["manifest"]["network"])
+            except (KeyError, TypeError):
+                continue
+            if network is not None:
+                collect(deployment, network)
+    
+    if not indexers_by_network:
+        discard_fetch_failures(failures)
+        log_message("Filtered deployment query returned no data, scanning all subgraphs for indexers...")
+        query_template = """{{
+            subgraphs(first: {first}, skip: {skip}, where: {{ currentVersion_not: null }}) {{
                 currentVersion {{
                     subgraphDeployment {{
+                        id
                         manifest {{
                             network
                         }}
-                        indexerAllocations(first: 1000, where: {{ status: Active }}) {{
+                        indexerAllocations(first: %d, where: {{ status: Active }}) {{
                             indexer {{
                                 id
                             }}
@@ -503,42 +1056,124 @@ def fetch_network_subgraph_counts(api_key: str) -> List[NetworkIndexerData]:
                     }}
                 }}
             }}
-        }}"""
+        }}""" % allocations_per_deployment
+        
+        for batch in fetch_paginated(url, query_template, "subgraphs"):
+            for item in batch:
+                try:
+                    deployment = item["currentVersion"]["subgraphDeployment"]
+                    network = canonical.get(deployment["manifest"]["network"])
+                except (KeyError, TypeError):
+                    continue
+                if network is not None:
+                    collect(deployment, network)
+    
+    if truncated:
+        log_message(f"Warning: {len(truncated)} deployments returned {allocations_per_deployment}+ allocations, fetching them separately...")
+        for network, deployment_id in dict.fromkeys(truncated):
+            indexers_by_network[network] |= fetch_deployment_indexers(url, deployment_id)
+    
+    return indexers_by_network
 
-        response = requests.post(url, json={"query": query}, headers=headers)
 
+def fetch_network_aggregates(url: str):
+    """
+    Fetch per-network subgraph counts and indexers from a server-side aggregate entity.
+    
+    Probes the schema first and only queries `networks { id subgraphCount indexers { id } }`
+    when the endpoint exposes such an entity.
+    
+    Args:
+        url: Network subgraph endpoint URL
+        
+    Returns:
+        Tuple of (counts, indexers_by_network), or None if no aggregate entity is available
+    """
+    probe_query = """
+    {
+      queryType: __type(name: "Query") { fields { name } }
+      networkType: __type(name: "Network") { fields { name } }
+    }
+    """
+    
+    try:
+        response = _post(url, probe_query)
         if response.status_code != 200:
-            log_message(f"Failed to fetch data: {response.status_code}")
-            break
+            return None
+        schema = (parse_json_response(response) or {}).get("data") or {}
+        query_fields = {field["name"] for field in (schema.get("queryType") or {}).get("fields") or ()}
+        network_fields = {field["name"] for field in (schema.get("networkType") or {}).get("fields") or ()}
+        if "networks" not in query_fields or not {"subgraphCount", "indexers"} <= network_fields:
+            return None
+        
+        log_message("Using server-side network aggregates...")
+        query = """
+        {
+          networks(first: 1000) {
+            id
+            subgraphCount
+            indexers(first: 1000) {
+              id
+            }
+          }
+        }
+        """
+        response = _post(url, query)
+        if response.status_code != 200:
+            return None
+        networks = ((parse_json_response(response) or {}).get("data") or {}).get("networks")
+        if not networks:
+            return None
+    except Exception as e:
+        log_message(f"Error fetching network aggregates: {e}")
+        return None
+    
+    counts = Counter()
+    indexers_by_network = defaultdict(set)
+    for network in networks:
+        try:
+            network_name = sys.intern(network["id"])
+            counts[network_name] = int(network["subgraphCount"] or 0)
+            indexers_by_network[network_name].update([indexer["id"] for indexer in network["indexers"] or ()])
+        except (KeyError, TypeError, ValueError):
+            continue
+    
+    return counts, indexers_by_network
 
-        batch = response.json().get("data", {}).get("subgraphs", [])
-        if not batch:
-            break
 
-        for item in batch:
-            deployment = item.get("currentVersion", {}).get("subgraphDeployment", {})
-            manifest = deployment.get("manifest")
-            if not manifest:
-                continue
-            network = manifest.get("network")
-            if not network:
-                continue
-            counts[network] = counts.get(network, 0) + 1
-            
-            # Process indexer allocations
-            allocations = deployment.get("indexerAllocations", [])
-            if network not in indexers_by_network:
-                indexers_by_network[network] = set()
-            for alloc in allocations:
-                indexer = alloc.get("indexer")
-                if indexer and "id" in indexer:
-                    indexers_by_network[network].add(indexer["id"])
+@cached_fetch(ttl_seconds=1800, decode=lambda rows: [NetworkIndexerData(**row) for row in rows])
+def fetch_network_subgraph_counts(api_key: str, top_n: int = TOP_NETWORKS) -> List[NetworkIndexerData]:
+    """
+    Fetch network names and count subgraphs and unique indexers per network.
+    
+    Uses a server-side per-network aggregate when the endpoint exposes one. Otherwise
+    subgraphs are counted for every network in a first lightweight pass, and indexer
+    allocations are then fetched only for the top networks by subgraph count,
+    since those are the only ones displayed.
+    
+    Args:
+        api_key: The Graph API key
+        top_n: Number of top networks to collect unique indexers for
+        
+    Returns:
+        List of NetworkIndexerData objects (unique_indexer_count is 0 outside the top networks)
+    """
+    url = f"https://gateway.thegraph.com/api/{api_key}/subgraphs/id/DZz4kDTdmzWLWsV373w2bSmoar3umKKH9y82SUKr5qmp"
 
-        skip += page_size
+    log_message("Fetching network subgraph counts...")
+    aggregates = fetch_network_aggregates(url)
+    if aggregates:
+        counts, indexers_by_network = aggregates
+    else:
+        counts = fetch_counts_only(url)
+        
+        top_networks = {network for network, _ in counts.most_common(top_n)}
+        log_message(f"Fetching unique indexers for top {len(top_networks)} networks...")
+        indexers_by_network = fetch_indexers_for(url, top_networks)
 
     result = []
     for network, subgraph_count in counts.items():
-        unique_indexer_count = len(indexers_by_network.get(network, set()))
+        unique_indexer_count = len(indexers_by_network[network])
         result.append(NetworkIndexerData(
             network_name=network,
             subgraph_count=subgraph_count,
@@ -549,6 +1184,35 @@ def fetch_network_subgraph_counts(api_key: str) -> List[NetworkIndexerData]:
     return result
 
 
+def summarize_top_networks(network_data: List[NetworkIndexerData], top_n: int = TOP_NETWORKS) -> tuple:
+    """
+    Total all subgraph counts and select the top networks in a single pass.
+    
+    Args:
+        network_data: List of NetworkIndexerData objects
+        top_n: Number of networks to select
+        
+    Returns:
+        Tuple of (total_all_networks, top networks sorted by subgraph count, total_top_networks)
+    """
+    get_count = attrgetter('subgraph_count')
+    total_all_networks = 0
+    heap = []
+    # Keys carry the negated position so ties keep their original order, as with a stable sort
+    for position, entry in enumerate(network_data):
+        count = get_count(entry)
+        total_all_networks += count
+        item = (count, -position, entry)
+        if len(heap) < top_n:
+            heapq.heappush(heap, item)
+        else:
+            heapq.heappushpop(heap, item)
+    
+    top_networks = [entry for _, _, entry in sorted(heap, reverse=True)]
+    total_top_networks = sum(map(get_count, top_networks))
+    return total_all_networks, top_networks, total_top_networks
+
+
 def save_stats_json(network_data: List[NetworkIndexerData], delegation_metrics: tuple, 
                     rewards_metrics: tuple, network_comparison: dict, quarterly_data: list,
                     output_path: str = "last_stats_run.json"):
@@ -570,15 +1234,12 @@ def save_stats_json(network_data: List[NetworkIndexerData], delegation_metrics:
     run_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     
     # Prepare subgraph count data
+    total_all_networks, sorted_network_data, total_top_20 = summarize_top_networks(network_data)
     subgraph_data = {
-        "total_all_networks": sum(entry.subgraph_count for entry in network_data),
+        "total_all_networks": total_all_networks,
         "networks": []
     }
     
-    # Sort by subgraph count and get top 20
-    sorted_network_data = sorted(network_data, key=lambda x: x.subgraph_count, reverse=True)[:20]
-    total_top_20 = sum(entry.subgraph_count for entry in sorted_network_data)
-    
     subgraph_data["total_top_20_networks"] = total_top_20
     subgraph_data["top_20_percentage"] = round((total_top_20 / subgraph_data["total_all_networks"] * 100) if subgraph_data["total_all_networks"] > 0 else 0, 2)
     
@@ -652,585 +1313,1001 @@ def save_stats_json(network_data: List[NetworkIndexerData], delegation_metrics:
     log_message(f"Statistics saved to {output_path}")
 
 
-def generate_html_dashboard(data: List[NetworkIndexerData], delegation_metrics: tuple, rewards_metrics: tuple, network_comparison: dict, quarterly_data: list, output_path: str = "index.html"):
+def save_metrics_json(network_data: List[NetworkIndexerData], output_path: str = "metrics.json",
+                      top_n: int = TOP_NETWORKS):
     """
-    Generate HTML dashboard with network metrics.
+    Save the per-network metrics as a flat JSON list for scripted consumers.
+    
+    Unique indexers are only collected for the top networks by subgraph count, so
+    `unique_indexer_count` is written as null for every other network.
     
     Args:
-        data: List of NetworkIndexerData objects
-        delegation_metrics: Tuple of (total_delegated, total_undelegated, net, events_list)
-        rewards_metrics: Tuple of (total_rewards, indexer_rewards, delegator_rewards)
-        network_comparison: Dictionary with 'arbitrum' and 'ethereum' network stats
-        quarterly_data: List of quarterly rewards data
-        output_path: Path to save the HTML file
+        network_data: List of NetworkIndexerData objects
+        output_path: Path to save the JSON file
+        top_n: Number of top networks whose unique indexers were collected
     """
-    # Calculate total across all networks
-    total_all_networks = sum(entry.subgraph_count for entry in data)
-    
-    # Sort by subgraph count and get top 20
-    sorted_data = sorted(data, key=lambda x: x.subgraph_count, reverse=True)[:20]
-    total_top_20 = sum(entry.subgraph_count for entry in sorted_data)
-    
-    # Calculate percentage
-    percentage = (total_top_20 / total_all_networks * 100) if total_all_networks > 0 else 0
-    
-    # Unpack delegation metrics
-    total_delegated, total_undelegated, net, events_list = delegation_metrics
-    net_color = "#4CAF50" if net >= 0 else "#f44336"
-    
-    # Unpack rewards metrics
-    total_rewards, indexer_rewards, delegator_rewards = rewards_metrics
-    
-    # Convert events_list to JSON string for JavaScript embedding
-    events_json = json.dumps(events_list).replace('</script>', '<\\/script>')
-    
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-    
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="Real-time dashboard showing The Graph Protocol metrics across the top 20 blockchain networks.">
-    <meta name="robots" content="index, follow">
-    
-    <meta property="og:title" content="The Graph Protocol Metrics Dashboard">
-    <meta property="og:description" content="Explore network metrics for The Graph Protocol's top 20 networks including subgraph counts and unique indexers.">
-    <meta property="og:type" content="website">
-    
-    <title>The Graph Protocol Metrics</title>
-    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600&display=swap" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Poppins', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: #0C0A1D;
-            min-height: 100vh;
-            padding: 20px;
-            color: #F8F6FF;
-        }}
-        
-        .breadcrumb {{
-            max-width: 1200px;
-            margin: 0 auto 15px auto;
-            padding: 12px 20px;
-            background: rgba(12, 10, 29, 0.6);
-            border-radius: 8px;
-            border: 1px solid #9CA3AF;
-            color: #F8F6FF;
-            font-size: 14px;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            gap: 8px;
-        }}
-        
-        .breadcrumb-left {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .period-toggle {{
-            display: flex;
-            align-items: center;
-            background: rgba(12, 10, 29, 0.8);
-            border: 2px solid #9CA3AF;
-            border-radius: 25px;
-            padding: 4px;
-            gap: 4px;
-            cursor: pointer;
-            user-select: none;
-        }}
-        
-        .period-toggle-option {{
-            padding: 6px 16px;
-            border-radius: 20px;
-            font-size: 13px;
-            font-weight: 500;
-            transition: all 0.3s ease;
-            color: #9CA3AF;
-            background: transparent;
-        }}
-        
-        .period-toggle-option.active {{
-            color: #F8F6FF;
-            background: #6F4CFF;
-            border-color: #6F4CFF;
-        }}
-        
-        .period-toggle-option:not(.active):hover {{
-            color: #F8F6FF;
-        }}
-        
-        .breadcrumb a {{
-            color: #9CA3AF;
-            text-decoration: none;
-            transition: color 0.3s ease;
-            display: inline-flex;
-            align-items: center;
-            gap: 6px;
-        }}
-        
-        .breadcrumb a:hover {{
-            color: #F8F6FF;
-        }}
-        
-        .breadcrumb-separator {{
-            color: #9CA3AF;
-            margin: 0 4px;
-            font-weight: 300;
-        }}
-        
-        .home-icon {{
-            width: 16px;
-            height: 16px;
-            display: inline-block;
-            position: relative;
-        }}
-        
-        .home-icon::before {{
-            content: '';
-            position: absolute;
-            left: 50%;
-            top: 0;
-            transform: translateX(-50%);
-            width: 0;
-            height: 0;
-            border-left: 8px solid transparent;
-            border-right: 8px solid transparent;
-            border-bottom: 8px solid currentColor;
-        }}
-        
-        .home-icon::after {{
-            content: '';
-            position: absolute;
-            left: 2px;
-            bottom: 0;
-            width: 12px;
-            height: 9px;
-            background-color: currentColor;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: #0C0A1D;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.3);
-            overflow: hidden;
-            border: 1px solid #9CA3AF;
-        }}
-        
-        .header {{
-            background: #0C0A1D;
-            color: #F8F6FF;
-            padding: 30px;
-            border-bottom: 1px solid #9CA3AF;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.2em;
-            margin: 0 0 10px 0;
-            font-weight: 500;
-        }}
-        
-        .header .subtitle {{
-            font-size: 0.95em;
-            opacity: 0.8;
-            font-weight: 300;
-        }}
-        
-        .content {{
-            padding: 30px;
-        }}
-        
-        .stats-container {{
-            display: flex;
-            gap: 15px;
-            margin-bottom: 30px;
-            justify-content: flex-start;
-            flex-wrap: wrap;
-        }}
-        
-        .stats-card {{
-            background: rgba(12, 10, 29, 0.6);
-            border: 1px solid #9CA3AF;
-            border-radius: 10px;
-            padding: 20px;
-            text-align: center;
-            flex: 0 0 200px;
-            height: 180px;
-            display: grid;
-            grid-template-rows: 45px 1fr 35px;
-            align-items: center;
-        }}
-        
-        .stats-card h2 {{
-            font-size: 0.95em;
-            margin: 0;
-            color: #9CA3AF;
-            font-weight: 400;
-            line-height: 1.2;
-            align-self: start;
-            padding-top: 5px;
-        }}
-        
-        .stats-card .total {{
-            font-size: 1.5em;
-            color: #F8F6FF;
-            font-weight: 600;
-            margin: 0;
-            line-height: 1;
-            align-self: center;
-        }}
-        
-        .stats-card .percentage {{
-            font-size: 0.85em;
-            color: #9CA3AF;
-            margin: 0;
-            align-self: end;
-            padding-bottom: 5px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 8px;
-        }}
-        
-        .toggle-arrow {{
-            cursor: pointer;
-            font-size: 1.5em;
-            color: #F8F6FF;
-            font-weight: bold;
-            transition: all 0.3s ease;
-            user-select: none;
-            padding: 6px;
-            border-radius: 6px;
-            background: rgba(111, 76, 255, 0.3);
-            border: 2px solid #6F4CFF;
-            margin-left: 8px;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            width: 32px;
-            height: 32px;
-        }}
-        
-        .toggle-arrow:hover {{
-            color: #FFFFFF;
-            background: rgba(111, 76, 255, 0.5);
-            border-color: #8B6FFF;
-            transform: scale(1.1);
-        }}
-        
-        .toggle-arrow.expanded {{
-            transform: rotate(90deg);
-            background: rgba(111, 76, 255, 0.5);
-        }}
-        
-        .toggle-arrow.expanded:hover {{
-            transform: rotate(90deg) scale(1.1);
-        }}
-        
-        .tooltip {{
-            position: relative;
-            cursor: help;
-        }}
-        
-        .tooltip .tooltip-text {{
-            visibility: hidden;
-            background-color: #333;
-            color: #F8F6FF;
-            text-align: center;
-            padding: 8px 12px;
-            border-radius: 6px;
-            position: absolute;
-            z-index: 9999;
-            bottom: 105%;
-            left: 50%;
-            transform: translateX(-50%);
-            opacity: 0;
-            transition: opacity 0.3s;
-            white-space: nowrap;
-            font-size: 0.85em;
-        }}
-        
-        .tooltip .tooltip-text::after {{
-            content: "";
-            position: absolute;
-            top: 100%;
-            left: 50%;
-            margin-left: -5px;
-            border-width: 5px;
-            border-style: solid;
-            border-color: #333 transparent transparent transparent;
-        }}
-        
-        .tooltip:hover .tooltip-text {{
-            visibility: visible;
-            opacity: 1;
-        }}
-        
-        #delegationTable {{
-            margin-top: 20px;
-            display: none;
-        }}
-        
-        #delegationTable table {{
-            font-size: 0.9em;
-        }}
-        
-        #delegationTable th {{
-            font-size: 0.9em;
-        }}
-        
-        #delegationTable td {{
-            font-size: 0.85em;
-        }}
-        
-        #networkComparisonTable {{
-            margin-top: 20px;
-            display: none;
-            padding-bottom: 20px;
-        }}
-        
-        #networkComparisonTable table {{
-            font-size: 0.9em;
-        }}
-        
-        #networkComparisonTable th {{
-            font-size: 0.9em;
-            background: rgba(111, 76, 255, 0.2);
-        }}
-        
-        #networkComparisonTable td {{
-            font-size: 0.85em;
-        }}
-        
-        #networkComparisonTable .network-header {{
-            background: rgba(111, 76, 255, 0.3);
-            font-weight: bold;
-            color: #F8F6FF;
-        }}
-        
-        #networkComparisonTable .row-label {{
-            font-weight: 600;
-            color: #9CA3AF;
-            text-align: left;
-            padding-left: 20px;
-        }}
-        
-        #networkComparisonTable .quarterly-section {{
-            margin-top: 30px;
-        }}
-        
-        #networkComparisonTable .quarterly-section h3 {{
-            color: #F8F6FF;
-            font-size: 1.3em;
-            margin-bottom: 20px;
-            text-align: center;
-        }}
-        
-        #networkComparisonTable .quarterly-section table {{
-            font-size: 0.9em;
-        }}
-        
-        #networkComparisonTable .quarterly-section th {{
-            background: rgba(111, 76, 255, 0.2);
-            font-size: 0.85em;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        #networkComparisonTable .quarterly-section td {{
-            font-size: 0.85em;
-        }}
-        
-        #networkComparisonTable .quarter-cell {{
-            font-weight: 600;
-            color: #6F4CFF;
-            font-size: 1.1em;
-        }}
-        
-        #networkComparisonTable .period-cell {{
-            color: #9CA3AF;
-            font-style: italic;
-        }}
-        
-        #networkComparisonTable .number-cell {{
-            font-family: 'Courier New', monospace;
-            font-weight: 500;
-        }}
-        
-        #networkComparisonTable .quarterly-section tbody tr:hover {{
-            background-color: rgba(111, 76, 255, 0.1);
-        }}
-        
-        #delegationTable a {{
-            color: #F8F6FF;
-            text-decoration: none;
-        }}
-        
-        #delegationTable a:hover {{
-            text-decoration: underline;
-        }}
-        
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            background: rgba(12, 10, 29, 0.4);
-            border: 1px solid #9CA3AF;
-            border-radius: 10px;
-            overflow: hidden;
-        }}
-        
-        th {{
-            background: rgba(12, 10, 29, 0.8);
-            color: #F8F6FF;
-            padding: 15px;
-            text-align: left;
-            font-weight: 500;
-            border-bottom: 1px solid #9CA3AF;
-        }}
-        
-        td {{
-            padding: 12px 15px;
-            border-bottom: 1px solid rgba(156, 163, 175, 0.3);
-        }}
-        
-        tr:last-child td {{
-            border-bottom: none;
-        }}
-        
-        tr:hover {{
-            background: rgba(248, 246, 255, 0.05);
-        }}
-        
-        .network-name {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .network-logo {{
-            width: 24px;
-            height: 24px;
-            object-fit: contain;
-        }}
-        
-        .rank {{
-            background: rgba(156, 163, 175, 0.3);
-            padding: 4px 10px;
-            border-radius: 20px;
-            font-size: 0.85em;
-            font-weight: 600;
-            min-width: 35px;
-            text-align: center;
-            display: inline-block;
-        }}
-        
-        .footer {{
-            padding: 20px 30px;
-            background: #0C0A1D;
-            color: #9CA3AF;
-            margin-top: 30px;
-            border-top: 1px solid #9CA3AF;
-            font-size: 0.8em;
-        }}
-        
-        .footer-content {{
-            max-width: 1140px;
-            margin: 0 auto;
-        }}
-        
-        .footer-top {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-            gap: 15px;
-        }}
-        
-        .footer-left {{
-            text-align: left;
-            flex: 0 0 auto;
-        }}
-        
-        .footer-right {{
-            text-align: right;
-            flex: 0 0 auto;
-        }}
-        
-        .footer a {{
-            color: #9CA3AF;
-            text-decoration: none;
-            transition: color 0.3s ease;
-        }}
-        
-        .footer a:hover {{
-            color: #F8F6FF;
-            text-decoration: underline;
-        }}
-        
-        .version {{
-            font-size: 0.9em;
-            opacity: 0.8;
-        }}
-        
-        .footer-separator {{
-            color: #9CA3AF;
-        }}
+    _, top_networks, _ = summarize_top_networks(network_data, top_n)
+    collected = {id(entry) for entry in top_networks}
+    rows = []
+    for entry in network_data:
+        row = asdict(entry)
+        if id(entry) not in collected:
+            row["unique_indexer_count"] = None
+        rows.append(row)
+    
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(rows))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False)
+    
+    log_message(f"Metrics saved to {output_path}")
+
+
+# Stylesheet and script written alongside the generated dashboard so browsers can cache them across reloads.
+# The files written get a content hash in their name (styles.<hash>.css), so they can be cached indefinitely.
+STYLESHEET_NAME = "styles.css"
+SCRIPT_NAME = "dashboard.js"
+
+# Cache rules for static hosts that read a `_headers` file (Netlify, Cloudflare Pages):
+# the content-hashed assets never change, while the dashboard HTML is regenerated regularly
+HEADERS_NAME = "_headers"
+HEADERS_RULES = """/*.css
+  Cache-Control: public, max-age=31536000, immutable
+/*.js
+  Cache-Control: public, max-age=31536000, immutable
+/*.html
+  Cache-Control: public, max-age=300, s-maxage=600
+/
+  Cache-Control: public, max-age=300, s-maxage=600
+"""
+
+DASHBOARD_CSS = """:root {
+    --accent: #6F4CFF;
+    --table-font-size: 0.9em;
+    --cell-font-size: 0.85em;
+}
+
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Poppins', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    background: #0C0A1D;
+    min-height: 100vh;
+    padding: 20px;
+    color: #F8F6FF;
+}
+
+.breadcrumb {
+    max-width: 1200px;
+    margin: 0 auto 15px auto;
+    padding: 12px 20px;
+    background: rgba(12, 10, 29, 0.6);
+    border-radius: 8px;
+    border: 1px solid #9CA3AF;
+    color: #F8F6FF;
+    font-size: 14px;
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    gap: 8px;
+}
+
+.breadcrumb-left {
+    display: flex;
+    align-items: center;
+    gap: 8px;
+}
+
+.period-toggle {
+    display: flex;
+    align-items: center;
+    background: rgba(12, 10, 29, 0.8);
+    border: 2px solid #9CA3AF;
+    border-radius: 25px;
+    padding: 4px;
+    gap: 4px;
+    cursor: pointer;
+    user-select: none;
+}
+
+.period-toggle-option {
+    padding: 6px 16px;
+    border-radius: 20px;
+    font-size: 13px;
+    font-weight: 500;
+    transition: all 0.3s ease;
+    color: #9CA3AF;
+    background: transparent;
+}
+
+.period-toggle-option.active {
+    color: #F8F6FF;
+    background: var(--accent);
+    border-color: var(--accent);
+}
+
+.period-toggle-option:not(.active):hover {
+    color: #F8F6FF;
+}
+
+.breadcrumb a {
+    color: #9CA3AF;
+    text-decoration: none;
+    transition: color 0.3s ease;
+    display: inline-flex;
+    align-items: center;
+    gap: 6px;
+}
+
+.breadcrumb a:hover {
+    color: #F8F6FF;
+}
+
+.breadcrumb-separator {
+    color: #9CA3AF;
+    margin: 0 4px;
+    font-weight: 300;
+}
+
+.home-icon {
+    width: 16px;
+    height: 16px;
+    display: inline-block;
+    position: relative;
+}
+
+.home-icon::before {
+    content: '';
+    position: absolute;
+    left: 50%;
+    top: 0;
+    transform: translateX(-50%);
+    width: 0;
+    height: 0;
+    border-left: 8px solid transparent;
+    border-right: 8px solid transparent;
+    border-bottom: 8px solid currentColor;
+}
+
+.home-icon::after {
+    content: '';
+    position: absolute;
+    left: 2px;
+    bottom: 0;
+    width: 12px;
+    height: 9px;
+    background-color: currentColor;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    background: #0C0A1D;
+    border-radius: 15px;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.3);
+    overflow: hidden;
+    border: 1px solid #9CA3AF;
+}
+
+.header {
+    background: #0C0A1D;
+    color: #F8F6FF;
+    padding: 30px;
+    border-bottom: 1px solid #9CA3AF;
+    text-align: center;
+}
+
+.header h1 {
+    font-size: 2.2em;
+    margin: 0 0 10px 0;
+    font-weight: 500;
+}
+
+.header .subtitle {
+    font-size: 0.95em;
+    opacity: 0.8;
+    font-weight: 300;
+}
+
+.content {
+    padding: 30px;
+}
+
+.stats-container {
+    display: flex;
+    gap: 15px;
+    margin-bottom: 30px;
+    justify-content: flex-start;
+    flex-wrap: wrap;
+}
+
+.stats-card {
+    background: rgba(12, 10, 29, 0.6);
+    border: 1px solid #9CA3AF;
+    border-radius: 10px;
+    padding: 20px;
+    text-align: center;
+    flex: 0 0 200px;
+    height: 180px;
+    display: grid;
+    grid-template-rows: 45px 1fr 35px;
+    align-items: center;
+}
+
+.stats-card h2 {
+    font-size: 0.95em;
+    margin: 0;
+    color: #9CA3AF;
+    font-weight: 400;
+    line-height: 1.2;
+    align-self: start;
+    padding-top: 5px;
+}
+
+.stats-card .total {
+    font-size: 1.5em;
+    color: #F8F6FF;
+    font-weight: 600;
+    margin: 0;
+    line-height: 1;
+    align-self: center;
+}
+
+.stats-card .percentage {
+    font-size: 0.85em;
+    color: #9CA3AF;
+    margin: 0;
+    align-self: end;
+    padding-bottom: 5px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    gap: 8px;
+}
+
+.toggle-arrow {
+    cursor: pointer;
+    font-size: 1.5em;
+    color: #F8F6FF;
+    font-weight: bold;
+    transition: all 0.3s ease;
+    user-select: none;
+    padding: 6px;
+    border-radius: 6px;
+    background: rgba(111, 76, 255, 0.3);
+    border: 2px solid var(--accent);
+    margin-left: 8px;
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    width: 32px;
+    height: 32px;
+}
+
+.toggle-arrow:hover {
+    color: #FFFFFF;
+    background: rgba(111, 76, 255, 0.5);
+    border-color: #8B6FFF;
+    transform: scale(1.1);
+}
+
+.toggle-arrow.expanded {
+    transform: rotate(90deg);
+    background: rgba(111, 76, 255, 0.5);
+}
+
+.toggle-arrow.expanded:hover {
+    transform: rotate(90deg) scale(1.1);
+}
+
+.tooltip {
+    position: relative;
+    cursor: help;
+}
+
+.tooltip .tooltip-text {
+    visibility: hidden;
+    background-color: #333;
+    color: #F8F6FF;
+    text-align: center;
+    padding: 8px 12px;
+    border-radius: 6px;
+    position: absolute;
+    z-index: 9999;
+    bottom: 105%;
+    left: 50%;
+    transform: translateX(-50%);
+    opacity: 0;
+    transition: opacity 0.3s;
+    white-space: nowrap;
+    font-size: 0.85em;
+}
+
+.tooltip .tooltip-text::after {
+    content: "";
+    position: absolute;
+    top: 100%;
+    left: 50%;
+    margin-left: -5px;
+    border-width: 5px;
+    border-style: solid;
+    border-color: #333 transparent transparent transparent;
+}
+
+.tooltip:hover .tooltip-text {
+    visibility: visible;
+    opacity: 1;
+}
+
+#delegationTable {
+    margin-top: 20px;
+    display: none;
+}
+
+#networkComparisonTable {
+    margin-top: 20px;
+    display: none;
+    padding-bottom: 20px;
+}
+
+#delegationTable table,
+#networkComparisonTable table,
+#delegationTable th,
+#networkComparisonTable th {
+    font-size: var(--table-font-size);
+}
+
+#delegationTable td,
+#networkComparisonTable td {
+    font-size: var(--cell-font-size);
+}
+
+#networkComparisonTable th {
+    background: rgba(111, 76, 255, 0.2);
+}
+
+#networkComparisonTable .network-header {
+    background: rgba(111, 76, 255, 0.3);
+    font-weight: bold;
+    color: #F8F6FF;
+}
+
+#networkComparisonTable .row-label {
+    font-weight: 600;
+    color: #9CA3AF;
+    text-align: left;
+    padding-left: 20px;
+}
+
+#networkComparisonTable .quarterly-section {
+    margin-top: 30px;
+}
+
+#networkComparisonTable .quarterly-section h3 {
+    color: #F8F6FF;
+    font-size: 1.3em;
+    margin-bottom: 20px;
+    text-align: center;
+}
+
+#networkComparisonTable .quarterly-section th {
+    font-size: var(--cell-font-size);
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+}
+
+#networkComparisonTable .quarter-cell {
+    font-weight: 600;
+    color: var(--accent);
+    font-size: 1.1em;
+}
+
+#networkComparisonTable .period-cell {
+    color: #9CA3AF;
+    font-style: italic;
+}
+
+#networkComparisonTable .number-cell {
+    font-family: 'Courier New', monospace;
+    font-weight: 500;
+}
+
+#networkComparisonTable .quarterly-section tbody tr:hover {
+    background-color: rgba(111, 76, 255, 0.1);
+}
+
+#delegationTable a {
+    color: #F8F6FF;
+    text-decoration: none;
+}
+
+#delegationTable a:hover {
+    text-decoration: underline;
+}
+
+.table-scroll {
+    overflow-x: auto;
+    -webkit-overflow-scrolling: touch;
+}
+
+table {
+    width: 100%;
+    border-collapse: collapse;
+    background: rgba(12, 10, 29, 0.4);
+    border: 1px solid #9CA3AF;
+    border-radius: 10px;
+    overflow: hidden;
+}
+
+th {
+    background: rgba(12, 10, 29, 0.8);
+    color: #F8F6FF;
+    padding: 15px;
+    text-align: left;
+    font-weight: 500;
+    border-bottom: 1px solid #9CA3AF;
+}
+
+td {
+    padding: 12px 15px;
+    border-bottom: 1px solid rgba(156, 163, 175, 0.3);
+}
+
+tr:last-child td {
+    border-bottom: none;
+}
+
+tr:hover {
+    background: rgba(248, 246, 255, 0.05);
+}
+
+.network-name {
+    display: flex;
+    align-items: center;
+    gap: 10px;
+}
+
+.network-link {
+    color: #F8F6FF;
+    text-decoration: none;
+}
+
+.network-logo {
+    width: 24px;
+    height: 24px;
+    object-fit: contain;
+}
+
+.rank {
+    background: rgba(156, 163, 175, 0.3);
+    padding: 4px 10px;
+    border-radius: 20px;
+    font-size: 0.85em;
+    font-weight: 600;
+    min-width: 35px;
+    text-align: center;
+    display: inline-block;
+}
+
+.footer {
+    padding: 20px 30px;
+    background: #0C0A1D;
+    color: #9CA3AF;
+    margin-top: 30px;
+    border-top: 1px solid #9CA3AF;
+    font-size: 0.8em;
+}
+
+.footer-content {
+    max-width: 1140px;
+    margin: 0 auto;
+}
+
+.footer-top {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 15px;
+    flex-wrap: wrap;
+    gap: 15px;
+}
+
+.footer-left {
+    text-align: left;
+    flex: 0 0 auto;
+}
+
+.footer-right {
+    text-align: right;
+    flex: 0 0 auto;
+}
+
+.footer a {
+    color: #9CA3AF;
+    text-decoration: none;
+    transition: color 0.3s ease;
+}
+
+.footer a:hover {
+    color: #F8F6FF;
+    text-decoration: underline;
+}
+
+.event-cell {
+    font-size: 0.85em;
+}
+
+.version {
+    font-size: 0.9em;
+    opacity: 0.8;
+}
+
+.footer-separator {
+    color: #9CA3AF;
+}
+
+.github-icon {
+    width: 14px;
+    height: 14px;
+    vertical-align: middle;
+    margin-right: 4px;
+}
+
+@media (max-width: 768px) {
+    .header h1 {
+        font-size: 1.5em;
+    }
+
+    .stats-container {
+        flex-direction: column;
+        align-items: center;
+    }
+
+    .stats-card {
+        width: 100%;
+        max-width: 300px;
+    }
+
+    .footer-top {
+        flex-direction: column;
+        align-items: flex-start;
+        gap: 12px;
+    }
+
+    .footer-left,
+    .footer-right {
+        text-align: left;
+        width: 100%;
+    }
+
+    table {
+        font-size: 0.9em;
+    }
+
+    th, td {
+        padding: 10px;
+    }
+}
+"""
+
+# Dashboard script, loaded with `defer`; reads the delegation events from the page's JSON data block
+DASHBOARD_JS = """// Delegation events data for filtering, embedded in the page as JSON
+const delegationEventsData = JSON.parse(document.getElementById('delegation-events-data').textContent);
+let currentPeriod = 'All';
+
+function filterEventsByPeriod(events, period) {
+    if (period === 'All') {
+        return events;
+    }
+
+    const now = Math.floor(Date.now() / 1000); // Current timestamp in seconds
+    const daysAgo = period === '90d' ? 90 : 30;
+    const cutoffTimestamp = now - (daysAgo * 24 * 60 * 60); // Approximate: days * hours * minutes * seconds
+
+    return events.filter(event => event.timestamp >= cutoffTimestamp);
+}
+
+function calculateTotals(filteredEvents) {
+    let totalDelegated = 0;
+    let totalUndelegated = 0;
+
+    filteredEvents.forEach(event => {
+        if (event.type === 'delegation') {
+            totalDelegated += event.tokens;
+        } else if (event.type === 'undelegation') {
+            totalUndelegated += event.tokens;
+        }
+    });
+
+    return {
+        total_delegated: totalDelegated,
+        total_undelegated: totalUndelegated,
+        net: totalDelegated - totalUndelegated
+    };
+}
+
+function updateDelegationDisplay(totals) {
+    // Find delegation cards by their h2 text content
+    const statsCards = document.querySelectorAll('.stats-container .stats-card');
+
+    statsCards.forEach(card => {
+        const h2 = card.querySelector('h2');
+        if (!h2) return;
+
+        const title = h2.textContent.trim();
+        const totalElement = card.querySelector('.total');
+
+        if (!totalElement) return;
+
+        if (title === 'Total Delegated') {
+            totalElement.textContent = totals.total_delegated.toLocaleString();
+        } else if (title === 'Total Undelegated') {
+            totalElement.textContent = totals.total_undelegated.toLocaleString();
+        } else if (title === 'Net') {
+            totalElement.textContent = totals.net.toLocaleString();
+            // Update color based on net value
+            totalElement.style.color = totals.net >= 0 ? '#4CAF50' : '#f44336';
+        }
+    });
+}
+
+// Rows are appended in batches when the sentinel below the table nears the viewport,
+// so only the rows a visitor scrolls to are built
+const EVENT_ROW_BATCH = 50;
+let pendingEventRows = [];
+let renderedEventRows = 0;
+let eventRowObserver = null;
+
+function largeEvents(events) {
+    // The table only lists transactions of 10,000 GRT or more
+    return events.filter(event => event.tokens >= 10000);
+}
+
+function createEventRow(event) {
+    const eventLabel = event.type === 'delegation' ? '✅ Delegation' : '❌ Undelegation';
+    const eventDate = new Date(event.timestamp * 1000).toISOString().replace('T', ' ').substring(0, 16);
+    const indexerShort = event.indexer.substring(0, 8) + '...' + event.indexer.substring(event.indexer.length - 6);
+    const delegatorShort = event.delegator.substring(0, 8) + '...' + event.delegator.substring(event.delegator.length - 6);
+
+    const row = document.createElement('tr');
+    row.innerHTML = `
+        <td><span class="event-cell">${eventLabel}</span></td>
+        <td>${event.tokens.toLocaleString()}</td>
+        <td><span class="event-cell">${eventDate}</span></td>
+        <td><a href="https://thegraph.com/explorer/profile/${event.indexer}" target="_blank"><span class="event-cell">${indexerShort}</span></a></td>
+        <td><a href="https://thegraph.com/explorer/profile/${event.delegator}" target="_blank"><span class="event-cell">${delegatorShort}</span></a></td>
+        <td><a href="https://arbiscan.io/tx/${event.tx_hash}" target="_blank"><span class="event-cell">view</span></a></td>
+    `;
+    return row;
+}
+
+function renderNextEventRows() {
+    const tableBody = document.querySelector('#delegationTable tbody');
+    if (!tableBody) return;
+
+    const end = Math.min(renderedEventRows + EVENT_ROW_BATCH, pendingEventRows.length);
+    const fragment = document.createDocumentFragment();
+    for (let i = renderedEventRows; i < end; i++) {
+        fragment.appendChild(createEventRow(pendingEventRows[i]));
+    }
+    tableBody.appendChild(fragment);
+    renderedEventRows = end;
+}
+
+function observeEventRows() {
+    const sentinel = document.getElementById('delegation-rows-sentinel');
+    if (!sentinel || !('IntersectionObserver' in window)) {
+        // No lazy rendering available: render all remaining rows at once
+        while (renderedEventRows < pendingEventRows.length) {
+            renderNextEventRows();
+        }
+        return;
+    }
+
+    if (!eventRowObserver) {
+        eventRowObserver = new IntersectionObserver(entries => {
+            if (!entries.some(entry => entry.isIntersecting)) return;
+            renderNextEventRows();
+            // Re-observe so the callback fires again if the sentinel is still in view
+            eventRowObserver.unobserve(sentinel);
+            if (renderedEventRows < pendingEventRows.length) {
+                eventRowObserver.observe(sentinel);
+            }
+        }, { rootMargin: '200px' });
+    }
+    eventRowObserver.unobserve(sentinel);
+    if (renderedEventRows < pendingEventRows.length) {
+        eventRowObserver.observe(sentinel);
+    }
+}
+
+function updateDelegationTable(filteredEvents) {
+    const tableBody = document.querySelector('#delegationTable tbody');
+    if (!tableBody) return;
+
+    // Clear existing rows and render the first batch of the new period
+    tableBody.innerHTML = '';
+    pendingEventRows = largeEvents(filteredEvents);
+    renderedEventRows = 0;
+    renderNextEventRows();
+    observeEventRows();
+}
+
+// The first rows are rendered into the page (possibly still deferred); continue after them
+(function initEventRows() {
+    const tableBody = document.querySelector('#delegationTable tbody');
+    pendingEventRows = largeEvents(delegationEventsData);
+    renderedEventRows = 0;
+    if (tableBody) {
+        renderedEventRows = tableBody.rows.length;
+        tableBody.querySelectorAll('template.deferred-content').forEach(template => {
+            renderedEventRows += template.content.querySelectorAll('tr').length;
+        });
+    }
+    observeEventRows();
+})();
+
+function togglePeriod(event) {
+    const clickedOption = event.target;
+    if (!clickedOption.classList.contains('period-toggle-option')) {
+        return;
+    }
+
+    const newPeriod = clickedOption.getAttribute('data-period');
+    if (newPeriod === currentPeriod) {
+        return;
+    }
+
+    // Remove active class from all options
+    const allOptions = document.querySelectorAll('.period-toggle-option');
+    allOptions.forEach(option => {
+        option.classList.remove('active');
+    });
+
+    // Add active class to clicked option
+    clickedOption.classList.add('active');
+    currentPeriod = newPeriod;
+
+    // Filter events based on period
+    const filteredEvents = filterEventsByPeriod(delegationEventsData, currentPeriod);
+
+    // Calculate totals from filtered events
+    const totals = calculateTotals(filteredEvents);
+
+    // Update display
+    updateDelegationDisplay(totals);
+    updateDelegationTable(filteredEvents);
+
+    console.log('Period changed to:', currentPeriod, 'Events:', filteredEvents.length, 'Totals:', totals);
+}
+
+// Hidden sections ship their markup inside <template> elements, which the browser
+// parses without building DOM nodes; the content is moved into place on first expand
+function renderDeferredContent(container) {
+    container.querySelectorAll('template.deferred-content').forEach(template => {
+        template.replaceWith(template.content);
+    });
+}
+
+function toggleExpand(element) {
+    element.classList.toggle('expanded');
+    const table = document.getElementById('networkTable');
+
+    if (element.classList.contains('expanded')) {
+        // Show table
+        renderDeferredContent(table);
+        table.style.display = 'table';
+        console.log('Table shown');
+    } else {
+        // Hide table
+        table.style.display = 'none';
+        console.log('Table hidden');
+    }
+}
+
+function toggleNetExpand(element) {
+    element.classList.toggle('expanded');
+    const delegationTable = document.getElementById('delegationTable');
+
+    if (element.classList.contains('expanded')) {
+        // Show delegation table
+        renderDeferredContent(delegationTable);
+        delegationTable.style.display = 'block';
+        console.log('Delegation table shown');
+    } else {
+        // Hide delegation table
+        delegationTable.style.display = 'none';
+        console.log('Delegation table hidden');
+    }
+}
+
+function toggleNetworkComparison(element) {
+    element.classList.toggle('expanded');
+    const comparisonTable = document.getElementById('networkComparisonTable');
+
+    if (element.classList.contains('expanded')) {
+        // Show network comparison table
+        renderDeferredContent(comparisonTable);
+        comparisonTable.style.display = 'block';
+        console.log('Network comparison table shown');
+    } else {
+        // Hide network comparison table
+        comparisonTable.style.display = 'none';
+        console.log('Network comparison table hidden');
+    }
+}
+"""
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip() + "\n"
+
+
+def minify_html(markup: str) -> str:
+    """
+    Collapse every whitespace run that contains a line break into a single newline.
+    
+    Removes the template indentation while rendering identically, since browsers
+    collapse such runs to a single space anyway.
+    """
+    return re.sub(r"\s*\n\s*", "\n", markup)
+
+
+def versioned_name(name: str, content: bytes) -> str:
+    """Insert a short content hash before the extension of an asset file name."""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}{ext}"
+
+
+def _asset(content: str) -> tuple:
+    data = content.encode("utf-8")
+    return data, hashlib.sha256(data).digest()
+
+
+_STYLESHEET_ASSET = _asset(minify_css(DASHBOARD_CSS))
+_SCRIPT_ASSET = _asset(DASHBOARD_JS)
+STYLESHEET_FILE = versioned_name(STYLESHEET_NAME, _STYLESHEET_ASSET[0])
+SCRIPT_FILE = versioned_name(SCRIPT_NAME, _SCRIPT_ASSET[0])
+
+# Static assets written alongside the dashboard, keyed by file name; the hash of their
+# content is compared against the files on disk before rewriting them
+_STATIC_ASSETS = {STYLESHEET_FILE: _STYLESHEET_ASSET, SCRIPT_FILE: _SCRIPT_ASSET}
+
+# Content-hashed asset names as written by write_static_assets(), any version
+_HASHED_ASSET_RE = re.compile("|".join(
+    rf"{re.escape(stem)}\.[0-9a-f]{{12}}{re.escape(ext)}"
+    for stem, ext in map(os.path.splitext, (STYLESHEET_NAME, SCRIPT_NAME))
+))
+
+
+def referenced_assets(html_path: str) -> set:
+    """
+    Return the content-hashed asset names referenced by a previously generated dashboard.
+    
+    Args:
+        html_path: Path to the existing dashboard HTML file
         
-        .github-icon {{
-            width: 14px;
-            height: 14px;
-            vertical-align: middle;
-            margin-right: 4px;
-        }}
+    Returns:
+        Set of asset file names, empty if the file does not exist
+    """
+    try:
+        with open(html_path, 'r', encoding='utf-8') as f:
+            return set(_HASHED_ASSET_RE.findall(f.read()))
+    except FileNotFoundError:
+        return set()
+
+
+def write_static_assets(output_dir: str, keep: set = frozenset()):
+    """
+    Write the dashboard stylesheet, script and `_headers` file next to the HTML output,
+    skipping unchanged files and removing older hashed versions of the assets.
+    
+    Args:
+        output_dir: Directory the dashboard HTML is written to
+        keep: Older asset names to keep, e.g. those referenced by the previous dashboard,
+            which CDNs may still serve until their cached copy expires
+    """
+    files = dict(_STATIC_ASSETS)
+    files[HEADERS_NAME] = _asset(HEADERS_RULES)
+    
+    for name, (content, content_hash) in files.items():
+        path = os.path.join(output_dir, name)
         
-        @media (max-width: 768px) {{
-            .header h1 {{
-                font-size: 1.5em;
-            }}
-            
-            .stats-container {{
-                flex-direction: column;
-                align-items: center;
-            }}
-            
-            .stats-card {{
-                width: 100%;
-                max-width: 300px;
-            }}
-            
-            .footer-top {{
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 12px;
-            }}
-            
-            .footer-left,
-            .footer-right {{
-                text-align: left;
-                width: 100%;
-            }}
-            
-            table {{
-                font-size: 0.9em;
-            }}
-            
-            th, td {{
-                padding: 10px;
-            }}
-        }}
-    </style>
+        try:
+            with open(path, 'rb') as f:
+                if hashlib.sha256(f.read()).digest() == content_hash:
+                    continue
+        except FileNotFoundError:
+            pass
+        
+        with open(path, 'wb') as f:
+            f.write(content)
+        
+        log_message(f"{name} saved to {path}")
+    
+    for name in _STATIC_ASSETS:
+        write_precompressed(os.path.join(output_dir, name))
+    
+    keep = {name + suffix for name in (*_STATIC_ASSETS, *keep) for suffix in ("", ".gz", ".br")}
+    for name in os.listdir(output_dir):
+        stem, suffix = os.path.splitext(name)
+        asset_name = stem if suffix in (".gz", ".br") else name
+        if _HASHED_ASSET_RE.fullmatch(asset_name) and name not in keep:
+            os.remove(os.path.join(output_dir, name))
+            log_message(f"Removed outdated {name}")
+
+
+def _write_gzip(content: bytes, path: str, f):
+    # Fixed mtime so unchanged content always compresses to identical bytes
+    with gzip.GzipFile(filename=os.path.basename(path), mode='wb', fileobj=f,
+                       compresslevel=9, mtime=0) as gz:
+        gz.write(content)
+
+
+def _write_brotli(content: bytes, path: str, f):
+    f.write(brotli.compress(content, quality=11))
+
+
+def write_precompressed(path: str):
+    """
+    Write compressed copies of a generated file next to it (`.gz`, plus `.br` when the
+    optional brotli module is installed), so web servers can serve them without
+    compressing on every request. Copies newer than the file itself are left untouched.
+    
+    Args:
+        path: Path to the generated file
+    """
+    encoders = [(".gz", _write_gzip)]
+    if brotli is not None:
+        encoders.append((".br", _write_brotli))
+    
+    source_mtime = os.path.getmtime(path)
+    content = None
+    for suffix, encode in encoders:
+        target = path + suffix
+        try:
+            if os.path.getmtime(target) >= source_mtime:
+                continue
+        except FileNotFoundError:
+            pass
+        
+        if content is None:
+            with open(path, 'rb') as f:
+                content = f.read()
+        tmp_path = target + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            encode(content, path, f)
+        os.replace(tmp_path, target)
+
+
+# Dashboard HTML templates, minified and parsed once at import time. Templates use `$name`
+# placeholders, so CSS/JavaScript braces need no escaping (a literal `$` is written `$$`).
+_HEAD_TPL = Template(minify_html("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta name="description" content="Real-time dashboard showing The Graph Protocol metrics across the top 20 blockchain networks.">
+    <meta name="robots" content="index, follow">
+    
+    <meta property="og:title" content="The Graph Protocol Metrics Dashboard">
+    <meta property="og:description" content="Explore network metrics for The Graph Protocol's top 20 networks including subgraph counts and unique indexers.">
+    <meta property="og:type" content="website">
+    
+    <title>The Graph Protocol Metrics</title>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600&display=swap" rel="stylesheet">
+    <link rel="stylesheet" href="${stylesheet}">
 </head>
 <body>
     <div class="breadcrumb">
@@ -1258,19 +2335,20 @@ def generate_html_dashboard(data: List[NetworkIndexerData], delegation_metrics:
             <div class="stats-container">
                 <div class="stats-card">
                     <h2>Total Subgraphs</h2>
-                    <div class="total">{total_all_networks:,}</div>
+                    <div class="total">${total_all_networks}</div>
                     <div class="percentage"></div>
                 </div>
                 <div class="stats-card">
                     <h2>Total Subgraphs<br/>(Top 20 Chains)</h2>
-                    <div class="total">{total_top_20:,}</div>
+                    <div class="total">${total_top_20}</div>
                     <div class="percentage">
-                        <span>{percentage:.1f}% of total</span>
+                        <span>${percentage}% of total</span>
                         <span class="toggle-arrow" onclick="toggleExpand(this)" title="Expand network details">›</span>
                     </div>
                 </div>
             </div>
             
+            <div class="table-scroll">
             <table id="networkTable" style="display: none; transition: all 0.3s ease;">
                 <thead>
                     <tr>
@@ -1280,56 +2358,46 @@ def generate_html_dashboard(data: List[NetworkIndexerData], delegation_metrics:
                         <th style="width: 25%;">Unique Indexers</th>
                     </tr>
                 </thead>
-                <tbody>"""
-    
-    # Add table rows
-    for idx, entry in enumerate(sorted_data, 1):
-        logo = NETWORK_LOGOS.get(entry.network_name.lower(), "")
-        logo_html = f'<img src="{logo}" alt="{entry.network_name}" class="network-logo" onerror="this.style.display=\'none\'" />' if logo else ""
-        
-        # Format network name
-        if entry.network_name.lower() == "mainnet":
-            name = "Ethereum (Mainnet)"
-        elif entry.network_name.lower() == "matic":
-            name = "Polygon (Matic)"
-        else:
-            name = entry.network_name.title()
-        
-        html_content += f"""
+                <tbody>
+                    <template class="deferred-content">"""))
+
+_NETWORK_ROW_TPL = Template(minify_html("""
                     <tr>
-                        <td><span class="rank">#{idx}</span></td>
+                        <td><span class="rank">#${idx}</span></td>
                         <td>
                             <div class="network-name">
-                                {logo_html}
-                                <a href="https://thegraph.com/explorer?indexedNetwork={entry.network_name}&orderBy=Query+Count&orderDirection=desc" 
-                                   target="_blank" style="color: #F8F6FF; text-decoration: none;">
-                                    {name}
+                                ${logo_html}
+                                <a href="https://thegraph.com/explorer?indexedNetwork=${network_name}&orderBy=Query+Count&orderDirection=desc" 
+                                   target="_blank" class="network-link">
+                                    ${name}
                                 </a>
                             </div>
                         </td>
-                        <td>{entry.subgraph_count:,}</td>
-                        <td>{entry.unique_indexer_count}</td>
+                        <td>${subgraph_count}</td>
+                        <td>${unique_indexer_count}</td>
                     </tr>
-"""
-    
-    html_content += f"""
+"""))
+
+_REWARDS_TPL = Template(minify_html("""
+                    </template>
                 </tbody>
             </table>
+            </div>
             
             <div class="stats-container" style="margin-top: 15px;">
                 <div class="stats-card">
                     <h2>Total Rewards<br/>Distributed</h2>
-                    <div class="total">{total_rewards:,}</div>
+                    <div class="total">${total_rewards}</div>
                     <div class="percentage" style="font-size: 0.75em;">GRT</div>
                 </div>
                 <div class="stats-card">
                     <h2>GRT Kept by<br/>Indexers</h2>
-                    <div class="total">{indexer_rewards:,}</div>
+                    <div class="total">${indexer_rewards}</div>
                     <div class="percentage" style="font-size: 0.75em;">GRT</div>
                 </div>
                 <div class="stats-card">
                     <h2>GRT Given to<br/>Delegators</h2>
-                    <div class="total">{delegator_rewards:,}</div>
+                    <div class="total">${delegator_rewards}</div>
                     <div class="percentage" style="font-size: 0.75em;">
                         <span>GRT</span>
                         <span class="toggle-arrow" onclick="toggleNetworkComparison(this)" title="Expand network comparison">›</span>
@@ -1338,6 +2406,8 @@ def generate_html_dashboard(data: List[NetworkIndexerData], delegation_metrics:
             </div>
             
             <div id="networkComparisonTable">
+                <template class="deferred-content">
+                <div class="table-scroll">
                 <table>
                     <thead>
                         <tr>
@@ -1346,57 +2416,41 @@ def generate_html_dashboard(data: List[NetworkIndexerData], delegation_metrics:
                             <th class="network-header" style="width: 30%;">Ethereum</th>
                         </tr>
                     </thead>
-                    <tbody>"""
-    
-    # Add network comparison data
-    arb_stats = network_comparison.get('arbitrum', {})
-    eth_stats = network_comparison.get('ethereum', {})
-    
-    # Calculate percentages for Arbitrum
-    arb_total = arb_stats.get('total_rewards', 0)
-    arb_indexer = arb_stats.get('indexer_rewards', 0)
-    arb_delegator = arb_stats.get('delegator_rewards', 0)
-    arb_indexer_pct = (arb_indexer / arb_total * 100) if arb_total > 0 else 0
-    arb_delegator_pct = (arb_delegator / arb_total * 100) if arb_total > 0 else 0
-    
-    # Calculate percentages for Ethereum
-    eth_total = eth_stats.get('total_rewards', 0)
-    eth_indexer = eth_stats.get('indexer_rewards', 0)
-    eth_delegator = eth_stats.get('delegator_rewards', 0)
-    eth_indexer_pct = (eth_indexer / eth_total * 100) if eth_total > 0 else 0
-    eth_delegator_pct = (eth_delegator / eth_total * 100) if eth_total > 0 else 0
-    
-    html_content += f"""
+                    <tbody>"""))
+
+_COMPARISON_TPL = Template(minify_html("""
                         <tr>
                             <td class="row-label">Total Rewards:</td>
-                            <td>{arb_total:,} GRT</td>
-                            <td>{eth_total:,} GRT</td>
+                            <td>${arb_total} GRT</td>
+                            <td>${eth_total} GRT</td>
                         </tr>
                         <tr>
                             <td class="row-label">Indexer Rewards:</td>
-                            <td>{arb_indexer:,} GRT ({arb_indexer_pct:.1f}%)</td>
-                            <td>{eth_indexer:,} GRT ({eth_indexer_pct:.1f}%)</td>
+                            <td>${arb_indexer} GRT (${arb_indexer_pct}%)</td>
+                            <td>${eth_indexer} GRT (${eth_indexer_pct}%)</td>
                         </tr>
                         <tr>
                             <td class="row-label">Delegator Rewards:</td>
-                            <td>{arb_delegator:,} GRT ({arb_delegator_pct:.1f}%)</td>
-                            <td>{eth_delegator:,} GRT ({eth_delegator_pct:.1f}%)</td>
+                            <td>${arb_delegator} GRT (${arb_delegator_pct}%)</td>
+                            <td>${eth_delegator} GRT (${eth_delegator_pct}%)</td>
                         </tr>
                         <tr>
                             <td class="row-label">Total Delegators (historical):</td>
-                            <td>{arb_stats.get('delegator_count', 0):,}</td>
-                            <td>{eth_stats.get('delegator_count', 0):,}</td>
+                            <td>${arb_delegator_count}</td>
+                            <td>${eth_delegator_count}</td>
                         </tr>
                         <tr>
                             <td class="row-label">Active Delegators (with GRT):</td>
-                            <td>{arb_stats.get('active_delegators', 0):,}</td>
-                            <td>{eth_stats.get('active_delegators', 0):,}</td>
+                            <td>${arb_active_delegators}</td>
+                            <td>${eth_active_delegators}</td>
                         </tr>
                     </tbody>
                 </table>
+                </div>
                 
                 <div class="quarterly-section">
                     <h3>Arbitrum Quarterly Rewards Distribution</h3>
+                    <div class="table-scroll">
                     <table>
                         <thead>
                             <tr>
@@ -1407,48 +2461,41 @@ def generate_html_dashboard(data: List[NetworkIndexerData], delegation_metrics:
                                 <th>Delegator Rewards (GRT)</th>
                             </tr>
                         </thead>
-                        <tbody>"""
-    
-    # Add quarterly data rows
-    for quarter in quarterly_data:
-        if quarter['total_rewards'] > 0:
-            indexer_pct = (quarter['indexer_rewards'] / quarter['total_rewards']) * 100
-            delegator_pct = (quarter['delegator_rewards'] / quarter['total_rewards']) * 100
-        else:
-            indexer_pct = 0
-            delegator_pct = 0
-        
-        html_content += f"""
+                        <tbody>"""))
+
+_QUARTER_ROW_TPL = Template(minify_html("""
                             <tr>
-                                <td class="quarter-cell">{quarter['quarter']}</td>
-                                <td class="period-cell">{quarter['period']}</td>
-                                <td class="number-cell">{quarter['total_rewards']:,}</td>
-                                <td class="number-cell">{quarter['indexer_rewards']:,} ({indexer_pct:.1f}%)</td>
-                                <td class="number-cell">{quarter['delegator_rewards']:,} ({delegator_pct:.1f}%)</td>
-                            </tr>"""
-    
-    html_content += f"""
+                                <td class="quarter-cell">${quarter}</td>
+                                <td class="period-cell">${period}</td>
+                                <td class="number-cell">${total_rewards}</td>
+                                <td class="number-cell">${indexer_rewards} (${indexer_pct}%)</td>
+                                <td class="number-cell">${delegator_rewards} (${delegator_pct}%)</td>
+                            </tr>"""))
+
+_DELEGATION_TPL = Template(minify_html("""
                         </tbody>
                     </table>
+                    </div>
                 </div>
+                </template>
             </div>
             
             <div class="stats-container" style="margin-top: 15px;">
                 <div class="stats-card tooltip">
                     <h2>Total Delegated</h2>
-                    <div class="total" style="color: #4CAF50;">{total_delegated:,}</div>
+                    <div class="total" style="color: #4CAF50;">${total_delegated}</div>
                     <div class="percentage" style="font-size: 0.75em;">GRT</div>
                     <span class="tooltip-text">Calculated for the last 1,000 transactions (table shows ≥10,000 GRT)</span>
                 </div>
                 <div class="stats-card tooltip">
                     <h2>Total Undelegated</h2>
-                    <div class="total" style="color: #f44336;">{total_undelegated:,}</div>
+                    <div class="total" style="color: #f44336;">${total_undelegated}</div>
                     <div class="percentage" style="font-size: 0.75em;">GRT</div>
                     <span class="tooltip-text">Calculated for the last 1,000 transactions (table shows ≥10,000 GRT)</span>
                 </div>
                 <div class="stats-card tooltip">
                     <h2>Net</h2>
-                    <div class="total" style="color: {net_color};">{net:,}</div>
+                    <div class="total" style="color: ${net_color};">${net}</div>
                     <div class="percentage" style="font-size: 0.75em;">
                         <span>GRT</span>
                         <span class="toggle-arrow" onclick="toggleNetExpand(this)" title="Expand delegation events">›</span>
@@ -1458,6 +2505,7 @@ def generate_html_dashboard(data: List[NetworkIndexerData], delegation_metrics:
             </div>
             
             <div id="delegationTable">
+                <div class="table-scroll">
                 <table>
                     <thead>
                         <tr>
@@ -1469,42 +2517,40 @@ def generate_html_dashboard(data: List[NetworkIndexerData], delegation_metrics:
                             <th style="width: 5%;">Tx</th>
                         </tr>
                     </thead>
-                    <tbody>"""
-    
-    # Add delegation events to table (filter for >= 10,000 GRT)
-    for event in events_list:
-        # Filter: only show transactions of 10,000 GRT or more
-        if event["tokens"] < 10000:
-            continue
-            
-        event_label = "✅ Delegation" if event["type"] == "delegation" else "❌ Undelegation"
-        event_date = datetime.fromtimestamp(event["timestamp"], tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
-        indexer_short = event["indexer"][:8] + "..." + event["indexer"][-6:]
-        delegator_short = event["delegator"][:8] + "..." + event["delegator"][-6:]
-        
-        html_content += f"""
+                    <tbody>
+                        <template class="deferred-content">"""))
+
+# Number of delegation event rows rendered server-side; the rest are rendered lazily in the browser
+INITIAL_EVENT_ROWS = 50
+
+_EVENT_ROW_TPL = Template(minify_html("""
                         <tr>
-                            <td><span style="font-size: 0.85em;">{event_label}</span></td>
-                            <td>{event["tokens"]:,}</td>
-                            <td><span style="font-size: 0.85em;">{event_date}</span></td>
-                            <td><a href="https://thegraph.com/explorer/profile/{event['indexer']}" target="_blank"><span style="font-size: 0.85em;">{indexer_short}</span></a></td>
-                            <td><a href="https://thegraph.com/explorer/profile/{event['delegator']}" target="_blank"><span style="font-size: 0.85em;">{delegator_short}</span></a></td>
-                            <td><a href="https://arbiscan.io/tx/{event['tx_hash']}" target="_blank"><span style="font-size: 0.85em;">view</span></a></td>
-                        </tr>"""
-    
-    html_content += f"""
+                            <td><span class="event-cell">${event_label}</span></td>
+                            <td>${tokens}</td>
+                            <td><span class="event-cell">${event_date}</span></td>
+                            <td><a href="https://thegraph.com/explorer/profile/${indexer}" target="_blank"><span class="event-cell">${indexer_short}</span></a></td>
+                            <td><a href="https://thegraph.com/explorer/profile/${delegator}" target="_blank"><span class="event-cell">${delegator_short}</span></a></td>
+                            <td><a href="https://arbiscan.io/tx/${tx_hash}" target="_blank"><span class="event-cell">view</span></a></td>
+                        </tr>"""))
+
+_FOOTER_HTML = minify_html("""
+                        </template>
                 </tbody>
             </table>
+            </div>
+            <div id="delegation-rows-sentinel"></div>
         </div>
         
         <div class="footer">
             <div class="footer-content">
                 <div class="footer-top">
                     <div class="footer-left">
-                        Generated on: {timestamp}
+                        Generated on: """)
+
+_FOOTER_TPL = Template(minify_html("""
                     </div>
                     <div class="footer-right">
-                        <span class="version">v{VERSION}</span>
+                        <span class="version">v${version}</span>
                         <span class="footer-separator">-</span>
                         <svg class="github-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/></svg><a href="https://github.com/pdiomede/metrics" target="_blank">View repo on GitHub</a>
                     </div>
@@ -1513,187 +2559,233 @@ def generate_html_dashboard(data: List[NetworkIndexerData], delegation_metrics:
         </div>
     </div>
     
-    <script>
-        // Store delegation events data for filtering
-        const delegationEventsData = {events_json};
-        let currentPeriod = 'All';
-        
-        function filterEventsByPeriod(events, period) {{
-            if (period === 'All') {{
-                return events;
-            }}
-            
-            const now = Math.floor(Date.now() / 1000); // Current timestamp in seconds
-            const daysAgo = period === '90d' ? 90 : 30;
-            const cutoffTimestamp = now - (daysAgo * 24 * 60 * 60); // Approximate: days * hours * minutes * seconds
-            
-            return events.filter(event => event.timestamp >= cutoffTimestamp);
-        }}
-        
-        function calculateTotals(filteredEvents) {{
-            let totalDelegated = 0;
-            let totalUndelegated = 0;
-            
-            filteredEvents.forEach(event => {{
-                if (event.type === 'delegation') {{
-                    totalDelegated += event.tokens;
-                }} else if (event.type === 'undelegation') {{
-                    totalUndelegated += event.tokens;
-                }}
-            }});
-            
-            return {{
-                total_delegated: totalDelegated,
-                total_undelegated: totalUndelegated,
-                net: totalDelegated - totalUndelegated
-            }};
-        }}
+    <script type="application/json" id="delegation-events-data">${events_json}</script>
+    <script src="${script}" defer></script>
+</body>
+</html>
+"""))
+
+
+# Marker appended to the generated dashboard recording the hash of its content
+_CONTENT_HASH_RE = re.compile(rb"<!-- content-hash: ([0-9a-f]+) -->")
+
+
+def read_content_hash(path: str):
+    """
+    Read the content hash recorded at the end of a previously generated dashboard.
+    
+    Args:
+        path: Path to the existing dashboard HTML file
         
-        function updateDelegationDisplay(totals) {{
-            // Find delegation cards by their h2 text content
-            const statsCards = document.querySelectorAll('.stats-container .stats-card');
-            
-            statsCards.forEach(card => {{
-                const h2 = card.querySelector('h2');
-                if (!h2) return;
-                
-                const title = h2.textContent.trim();
-                const totalElement = card.querySelector('.total');
-                
-                if (!totalElement) return;
-                
-                if (title === 'Total Delegated') {{
-                    totalElement.textContent = totals.total_delegated.toLocaleString();
-                }} else if (title === 'Total Undelegated') {{
-                    totalElement.textContent = totals.total_undelegated.toLocaleString();
-                }} else if (title === 'Net') {{
-                    totalElement.textContent = totals.net.toLocaleString();
-                    // Update color based on net value
-                    totalElement.style.color = totals.net >= 0 ? '#4CAF50' : '#f44336';
-                }}
-            }});
-        }}
+    Returns:
+        Hex digest string, or None if the file or marker is missing
+    """
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 512))
+            match = _CONTENT_HASH_RE.search(f.read())
+    except FileNotFoundError:
+        return None
+    return match.group(1).decode("ascii") if match else None
+
+
+def generate_html_dashboard(data: List[NetworkIndexerData], delegation_metrics: tuple, rewards_metrics: tuple, network_comparison: dict, quarterly_data: list, output_path: str = "index.html"):
+    """
+    Generate HTML dashboard with network metrics.
+    
+    Args:
+        data: List of NetworkIndexerData objects
+        delegation_metrics: Tuple of (total_delegated, total_undelegated, net, events_list)
+        rewards_metrics: Tuple of (total_rewards, indexer_rewards, delegator_rewards)
+        network_comparison: Dictionary with 'arbitrum' and 'ethereum' network stats
+        quarterly_data: List of quarterly rewards data
+        output_path: Path to save the HTML file
+    """
+    # Total across all networks and select the top 20 by subgraph count in one pass
+    total_all_networks, sorted_data, total_top_20 = summarize_top_networks(data)
+    
+    # Calculate percentage
+    percentage = (total_top_20 / total_all_networks * 100) if total_all_networks > 0 else 0
+    
+    # Unpack delegation metrics
+    total_delegated, total_undelegated, net, events_list = delegation_metrics
+    net_color = "#4CAF50" if net >= 0 else "#f44336"
+    
+    # Unpack rewards metrics
+    total_rewards, indexer_rewards, delegator_rewards = rewards_metrics
+    
+    # Convert events_list to JSON string for JavaScript embedding
+    events_json = json.dumps(events_list).replace('</script>', '<\\/script>')
+    
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    
+    # Keep the assets of the dashboard being replaced for one more run
+    write_static_assets(os.path.dirname(os.path.abspath(output_path)), keep=referenced_assets(output_path))
+    
+    # Stream each section straight to a buffered temporary file instead of building one
+    # large string, hashing everything except the generation timestamp along the way
+    tmp_path = output_path + ".tmp"
+    content_hash = hashlib.blake2b(digest_size=8)
+    with open(tmp_path, 'w', encoding='utf-8', buffering=64 * 1024) as f:
+        def write(chunk: str, hashed: bool = True):
+            f.write(chunk)
+            if hashed:
+                content_hash.update(chunk.encode('utf-8'))
+        
+        write(_HEAD_TPL.substitute(
+            stylesheet=STYLESHEET_FILE,
+            total_all_networks=f"{total_all_networks:,}",
+            total_top_20=f"{total_top_20:,}",
+            percentage=f"{percentage:.1f}"
+        ))
         
-        function updateDelegationTable(filteredEvents) {{
-            const tableBody = document.querySelector('#delegationTable tbody');
-            if (!tableBody) return;
-            
-            // Clear existing rows
-            tableBody.innerHTML = '';
-            
-            // Filter for >= 10,000 GRT and add rows
-            filteredEvents.forEach(event => {{
-                if (event.tokens < 10000) return;
-                
-                const eventLabel = event.type === 'delegation' ? '✅ Delegation' : '❌ Undelegation';
-                const eventDate = new Date(event.timestamp * 1000).toISOString().replace('T', ' ').substring(0, 16);
-                const indexerShort = event.indexer.substring(0, 8) + '...' + event.indexer.substring(event.indexer.length - 6);
-                const delegatorShort = event.delegator.substring(0, 8) + '...' + event.delegator.substring(event.delegator.length - 6);
-                
-                const row = document.createElement('tr');
-                row.innerHTML = `
-                    <td><span style="font-size: 0.85em;">${{eventLabel}}</span></td>
-                    <td>${{event.tokens.toLocaleString()}}</td>
-                    <td><span style="font-size: 0.85em;">${{eventDate}}</span></td>
-                    <td><a href="https://thegraph.com/explorer/profile/${{event.indexer}}" target="_blank"><span style="font-size: 0.85em;">${{indexerShort}}</span></a></td>
-                    <td><a href="https://thegraph.com/explorer/profile/${{event.delegator}}" target="_blank"><span style="font-size: 0.85em;">${{delegatorShort}}</span></a></td>
-                    <td><a href="https://arbiscan.io/tx/${{event.tx_hash}}" target="_blank"><span style="font-size: 0.85em;">view</span></a></td>
-                `;
-                tableBody.appendChild(row);
-            }});
-        }}
+        # Add table rows
+        for idx, entry in enumerate(sorted_data, 1):
+            key = entry.network_name.lower()
+            logo_html = _LOGO_HTML.get(key, "")
+            name = _DISPLAY_OVERRIDES.get(key) or entry.network_name.title()
+        
+            write(_NETWORK_ROW_TPL.substitute(
+                idx=idx,
+                logo_html=logo_html,
+                network_name=entry.network_name,
+                name=name,
+                subgraph_count=f"{entry.subgraph_count:,}",
+                unique_indexer_count=entry.unique_indexer_count
+            ))
+        
+        write(_REWARDS_TPL.substitute(
+            total_rewards=f"{total_rewards:,}",
+            indexer_rewards=f"{indexer_rewards:,}",
+            delegator_rewards=f"{delegator_rewards:,}"
+        ))
         
-        function togglePeriod(event) {{
-            const clickedOption = event.target;
-            if (!clickedOption.classList.contains('period-toggle-option')) {{
-                return;
-            }}
-            
-            const newPeriod = clickedOption.getAttribute('data-period');
-            if (newPeriod === currentPeriod) {{
-                return;
-            }}
-            
-            // Remove active class from all options
-            const allOptions = document.querySelectorAll('.period-toggle-option');
-            allOptions.forEach(option => {{
-                option.classList.remove('active');
-            }});
-            
-            // Add active class to clicked option
-            clickedOption.classList.add('active');
-            currentPeriod = newPeriod;
-            
-            // Filter events based on period
-            const filteredEvents = filterEventsByPeriod(delegationEventsData, currentPeriod);
-            
-            // Calculate totals from filtered events
-            const totals = calculateTotals(filteredEvents);
-            
-            // Update display
-            updateDelegationDisplay(totals);
-            updateDelegationTable(filteredEvents);
-            
-            console.log('Period changed to:', currentPeriod, 'Events:', filteredEvents.length, 'Totals:', totals);
-        }}
+        # Add network comparison data
+        arb_stats = network_comparison.get('arbitrum', {})
+        eth_stats = network_comparison.get('ethereum', {})
+        
+        # Calculate percentages for Arbitrum
+        arb_total = arb_stats.get('total_rewards', 0)
+        arb_indexer = arb_stats.get('indexer_rewards', 0)
+        arb_delegator = arb_stats.get('delegator_rewards', 0)
+        arb_indexer_pct = (arb_indexer / arb_total * 100) if arb_total > 0 else 0
+        arb_delegator_pct = (arb_delegator / arb_total * 100) if arb_total > 0 else 0
+        
+        # Calculate percentages for Ethereum
+        eth_total = eth_stats.get('total_rewards', 0)
+        eth_indexer = eth_stats.get('indexer_rewards', 0)
+        eth_delegator = eth_stats.get('delegator_rewards', 0)
+        eth_indexer_pct = (eth_indexer / eth_total * 100) if eth_total > 0 else 0
+        eth_delegator_pct = (eth_delegator / eth_total * 100) if eth_total > 0 else 0
+        
+        write(_COMPARISON_TPL.substitute(
+            arb_total=f"{arb_total:,}",
+            eth_total=f"{eth_total:,}",
+            arb_indexer=f"{arb_indexer:,}",
+            arb_indexer_pct=f"{arb_indexer_pct:.1f}",
+            eth_indexer=f"{eth_indexer:,}",
+            eth_indexer_pct=f"{eth_indexer_pct:.1f}",
+            arb_delegator=f"{arb_delegator:,}",
+            arb_delegator_pct=f"{arb_delegator_pct:.1f}",
+            eth_delegator=f"{eth_delegator:,}",
+            eth_delegator_pct=f"{eth_delegator_pct:.1f}",
+            arb_delegator_count=f"{arb_stats.get('delegator_count', 0):,}",
+            eth_delegator_count=f"{eth_stats.get('delegator_count', 0):,}",
+            arb_active_delegators=f"{arb_stats.get('active_delegators', 0):,}",
+            eth_active_delegators=f"{eth_stats.get('active_delegators', 0):,}"
+        ))
         
-        function toggleExpand(element) {{
-            element.classList.toggle('expanded');
-            const table = document.getElementById('networkTable');
-            
-            if (element.classList.contains('expanded')) {{
-                // Show table
-                table.style.display = 'table';
-                console.log('Table shown');
-            }} else {{
-                // Hide table
-                table.style.display = 'none';
-                console.log('Table hidden');
-            }}
-        }}
+        # Add quarterly data rows
+        for quarter in quarterly_data:
+            if quarter['total_rewards'] > 0:
+                indexer_pct = (quarter['indexer_rewards'] / quarter['total_rewards']) * 100
+                delegator_pct = (quarter['delegator_rewards'] / quarter['total_rewards']) * 100
+            else:
+                indexer_pct = 0
+                delegator_pct = 0
+        
+            write(_QUARTER_ROW_TPL.substitute(
+                quarter=quarter['quarter'],
+                period=quarter['period'],
+                total_rewards=f"{quarter['total_rewards']:,}",
+                indexer_rewards=f"{quarter['indexer_rewards']:,}",
+                indexer_pct=f"{indexer_pct:.1f}",
+                delegator_rewards=f"{quarter['delegator_rewards']:,}",
+                delegator_pct=f"{delegator_pct:.1f}"
+            ))
+        
+        write(_DELEGATION_TPL.substitute(
+            total_delegated=f"{total_delegated:,}",
+            total_undelegated=f"{total_undelegated:,}",
+            net_color=net_color,
+            net=f"{net:,}"
+        ))
         
-        function toggleNetExpand(element) {{
-            element.classList.toggle('expanded');
-            const delegationTable = document.getElementById('delegationTable');
-            
-            if (element.classList.contains('expanded')) {{
-                // Show delegation table
-                delegationTable.style.display = 'block';
-                console.log('Delegation table shown');
-            }} else {{
-                // Hide delegation table
-                delegationTable.style.display = 'none';
-                console.log('Delegation table hidden');
-            }}
-        }}
+        # Add delegation events to table: only transactions of 10,000 GRT or more are shown
+        # Only the first rows are written into the page; dashboard.js renders the rest
+        # from the embedded events as the table is scrolled
+        large_events = [event for event in events_list if event["tokens"] >= 10000]
+        event_fields = itemgetter("type", "tokens", "timestamp", "indexer", "delegator", "tx_hash")
+        for event_type, tokens, event_time, indexer, delegator, tx_hash in map(event_fields, large_events[:INITIAL_EVENT_ROWS]):
+            event_label = "✅ Delegation" if event_type == "delegation" else "❌ Undelegation"
+            # time.gmtime avoids building a datetime and going through strftime for every row
+            t = time.gmtime(event_time)
+            event_date = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}"
+        
+            write(_EVENT_ROW_TPL.substitute(
+                event_label=event_label,
+                tokens=f"{tokens:,}",
+                event_date=event_date,
+                indexer=indexer,
+                indexer_short=f"{indexer[:8]}...{indexer[-6:]}",
+                delegator=delegator,
+                delegator_short=f"{delegator[:8]}...{delegator[-6:]}",
+                tx_hash=tx_hash
+            ))
+        
+        write(_FOOTER_HTML)
+        write(timestamp, hashed=False)
+        write(_FOOTER_TPL.substitute(
+            version=VERSION,
+            events_json=events_json,
+            script=SCRIPT_FILE
+        ))
         
-        function toggleNetworkComparison(element) {{
-            element.classList.toggle('expanded');
-            const comparisonTable = document.getElementById('networkComparisonTable');
-            
-            if (element.classList.contains('expanded')) {{
-                // Show network comparison table
-                comparisonTable.style.display = 'block';
-                console.log('Network comparison table shown');
-            }} else {{
-                // Hide network comparison table
-                comparisonTable.style.display = 'none';
-                console.log('Network comparison table hidden');
-            }}
-        }}
-    </script>
-</body>
-</html>
-"""
+        digest = content_hash.hexdigest()
+        f.write(f"<!-- content-hash: {digest} -->\n")
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Leave the existing dashboard untouched (and downstream caches valid) when only the timestamp changed
+    if read_content_hash(output_path) == digest:
+        os.remove(tmp_path)
+        log_message("No changes; skipping write.")
+        write_precompressed(output_path)
+        return
     
+    os.replace(tmp_path, output_path)
+    write_precompressed(output_path)
     log_message(f"Dashboard saved to {output_path}")
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Generate The Graph Protocol metrics dashboard")
+    parser.add_argument("--html", dest="html", action="store_true", default=True,
+                        help="generate the HTML dashboard (default)")
+    parser.add_argument("--no-html", dest="html", action="store_false",
+                        help="skip the HTML dashboard, e.g. when only JSON output is needed")
+    parser.add_argument("--json-out", metavar="PATH", help="also write per-network metrics as JSON to PATH")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore cached results and query every subgraph again")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main execution function."""
+    args = parse_args(argv)
+    _FETCH_CACHE["enabled"] = True
+    _FETCH_CACHE["refresh"] = args.force
+    
     log_message("Starting The Graph Protocol Metrics Dashboard Generator...")
     log_message(f"Version: v{VERSION}")
     
@@ -1706,20 +2798,18 @@ def main():
         log_message("Please create a .env file with GRAPH_API_KEY=your_api_key")
         return
     
-    # Fetch quarterly data
-    quarterly_data = fetch_quarterly_arbitrum_data(api_key)
-    
-    # Fetch network comparison stats
-    network_comparison = fetch_network_comparison_stats(api_key)
-    
-    # Fetch rewards metrics
-    rewards_metrics = fetch_rewards_metrics(api_key)
-    
-    # Fetch delegation metrics
-    delegation_metrics = fetch_delegation_metrics(api_key)
-    
-    # Fetch network data
-    network_data = fetch_network_subgraph_counts(api_key)
+    # The metric fetches are independent I/O-bound queries, so run them concurrently;
+    # rewards reuse the comparison totals and run in the same task right after them
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        network_data_future = executor.submit(fetch_network_subgraph_counts, api_key)
+        quarterly_future = executor.submit(fetch_quarterly_arbitrum_data, api_key)
+        comparison_future = executor.submit(fetch_network_comparison_and_rewards, api_key)
+        delegation_future = executor.submit(fetch_delegation_metrics, api_key)
+        
+        quarterly_data = quarterly_future.result()
+        network_comparison, rewards_metrics = comparison_future.result()
+        delegation_metrics = delegation_future.result()
+        network_data = network_data_future.result()
     
     if not network_data:
         log_message("ERROR: No data retrieved")
@@ -1728,8 +2818,14 @@ def main():
     # Save all statistics to JSON file
     save_stats_json(network_data, delegation_metrics, rewards_metrics, network_comparison, quarterly_data)
     
+    if args.json_out:
+        save_metrics_json(network_data, args.json_out)
+    
     # Generate HTML dashboard
-    generate_html_dashboard(network_data, delegation_metrics, rewards_metrics, network_comparison, quarterly_data)
+    if args.html:
+        generate_html_dashboard(network_data, delegation_metrics, rewards_metrics, network_comparison, quarterly_data)
+    else:
+        log_message("Skipping HTML dashboard (--no-html)")
     
     log_message("Dashboard generation completed successfully!")
 